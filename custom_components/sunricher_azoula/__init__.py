@@ -15,6 +15,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN, MANUFACTURER
 from .sdk.capability_detector import CapabilityDetector
@@ -25,6 +26,16 @@ from .types import AzoulaSmartConfigEntry, AzoulaSmartData
 
 _LOGGER = logging.getLogger(__name__)
 
+PLATFORM_MAP = {
+    "light": Platform.LIGHT,
+    "sensor": Platform.SENSOR,
+    "binary_sensor": Platform.BINARY_SENSOR,
+    "button": Platform.BUTTON,
+    "number": Platform.NUMBER,
+    "select": Platform.SELECT,
+    "switch": Platform.SWITCH,
+}
+
 
 def _remove_missing_devices(
     hass: HomeAssistant,
@@ -34,24 +45,22 @@ def _remove_missing_devices(
 ) -> None:
     """Detach devices that are no longer provided by the gateway."""
     device_registry = dr.async_get(hass)
-    known_device_ids = {device.device_id for device in devices}
+    known_device_ids = frozenset(device.device_id for device in devices)
 
     for device_entry in dr.async_entries_for_config_entry(
         device_registry, entry.entry_id
     ):
-        if gateway_identifier in device_entry.identifiers:
+        identifiers = device_entry.identifiers
+        if gateway_identifier in identifiers:
             continue
 
-        domain_device_ids = {
-            identifier[1]
-            for identifier in device_entry.identifiers
-            if identifier[0] == DOMAIN
-        }
-
-        if not domain_device_ids:
+        if any(
+            domain == DOMAIN and identifier in known_device_ids
+            for domain, identifier in identifiers
+        ):
             continue
 
-        if domain_device_ids.isdisjoint(known_device_ids):
+        if any(domain == DOMAIN for domain, _ in identifiers):
             device_registry.async_update_device(
                 device_entry.id,
                 remove_config_entry_id=entry.entry_id,
@@ -83,8 +92,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: AzoulaSmartConfigEntry)
         serial_number=gateway.gateway_id,
     )
 
+    gateway_identifier = (DOMAIN, gateway.gateway_id)
     devices = await gateway.discover_devices(load_tsl=True)
-    _remove_missing_devices(hass, entry, devices, (DOMAIN, gateway.gateway_id))
+    _remove_missing_devices(hass, entry, devices, gateway_identifier)
 
     _LOGGER.info(
         "Discovered %d device(s) on gateway %s",
@@ -103,30 +113,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: AzoulaSmartConfigEntry)
             platforms,
         )
 
-    entry.runtime_data = AzoulaSmartData(
-        gateway=gateway,
-        devices=devices,
-    )
-
-    platform_map = {
-        "light": Platform.LIGHT,
-        "sensor": Platform.SENSOR,
-        "binary_sensor": Platform.BINARY_SENSOR,
-        "button": Platform.BUTTON,
-        "number": Platform.NUMBER,
-        "select": Platform.SELECT,
-        "switch": Platform.SWITCH,
-    }
     platforms_to_load = [
-        platform_map[p] for p in required_platforms if p in platform_map
+        PLATFORM_MAP[p] for p in required_platforms if p in PLATFORM_MAP
     ]
 
     # Always load button platform for identify functionality
     if Platform.BUTTON not in platforms_to_load:
         platforms_to_load.append(Platform.BUTTON)
 
-    if platforms_to_load:
-        await hass.config_entries.async_forward_entry_setups(entry, platforms_to_load)
+    entry.runtime_data = AzoulaSmartData(
+        gateway=gateway,
+        devices=devices,
+        device_info={
+            device.device_id: DeviceInfo(
+                identifiers={(DOMAIN, device.device_id)},
+                name=device.name,
+                manufacturer=device.manufacturer,
+                model=device.product_id,
+                via_device=gateway_identifier,
+            )
+            for device in devices
+        },
+        platforms=platforms_to_load,
+    )
+
+    await hass.config_entries.async_forward_entry_setups(entry, platforms_to_load)
 
     return True
 
@@ -135,33 +146,8 @@ async def async_unload_entry(
     hass: HomeAssistant, entry: AzoulaSmartConfigEntry
 ) -> bool:
     """Unload a config entry."""
-    required_platforms: set[str] = set()
-    for device in entry.runtime_data.devices:
-        platforms = CapabilityDetector.get_required_platforms(device)
-        required_platforms.update(platforms)
-
-    platform_map = {
-        "light": Platform.LIGHT,
-        "sensor": Platform.SENSOR,
-        "binary_sensor": Platform.BINARY_SENSOR,
-        "button": Platform.BUTTON,
-        "number": Platform.NUMBER,
-        "select": Platform.SELECT,
-        "switch": Platform.SWITCH,
-    }
-    platforms_to_unload = [
-        platform_map[p] for p in required_platforms if p in platform_map
-    ]
-
-    # Always unload button platform
-    if Platform.BUTTON not in platforms_to_unload:
-        platforms_to_unload.append(Platform.BUTTON)
-
     await entry.runtime_data.gateway.disconnect()
 
-    if platforms_to_unload:
-        return await hass.config_entries.async_unload_platforms(
-            entry, platforms_to_unload
-        )
-
-    return True
+    return await hass.config_entries.async_unload_platforms(
+        entry, entry.runtime_data.platforms
+    )
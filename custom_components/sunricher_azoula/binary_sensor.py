@@ -2,24 +2,21 @@
 
 from __future__ import annotations
 
-import logging
-
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
-from .sdk.const import CallbackEventType
+from .entity import AzoulaEntity
+from .sdk.const import PROPERTY_OCCUPANCY_STATE
 from .sdk.device import AzoulaDevice
 from .sdk.gateway import AzoulaGateway
 from .sdk.types import PropertyParams
 from .types import AzoulaSmartConfigEntry
 
-_LOGGER = logging.getLogger(__name__)
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,76 +24,42 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Azoula Smart binary sensors from a config entry."""
+    data = entry.runtime_data
     async_add_entities(
         [
-            AzoulaOccupancySensor(device, entry.runtime_data.gateway)
-            for device in entry.runtime_data.devices
-            if device.has_property("OccupancyState")
+            AzoulaOccupancySensor(
+                device, data.gateway, data.device_info[device.device_id]
+            )
+            for device in data.devices
+            if device.has_property(PROPERTY_OCCUPANCY_STATE)
         ]
     )
 
 
-class AzoulaOccupancySensor(BinarySensorEntity):
+class AzoulaOccupancySensor(AzoulaEntity, BinarySensorEntity):
     """Representation of an Azoula Smart occupancy sensor."""
 
-    _attr_has_entity_name = True
+    _attr_name = "Occupancy"
     _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
     _attr_is_on: bool | None = None
+    _required_properties = (PROPERTY_OCCUPANCY_STATE,)
 
-    def __init__(self, device: AzoulaDevice, gateway: AzoulaGateway) -> None:
+    def __init__(
+        self, device: AzoulaDevice, gateway: AzoulaGateway, device_info: DeviceInfo
+    ) -> None:
         """Initialize the binary sensor entity."""
-        self._device = device
-        self._gateway = gateway
-        self._attr_name = "Occupancy"
+        super().__init__(device, gateway, device_info)
         self._attr_unique_id = f"{device.device_id}-occupancy"
-        self._attr_available = device.online
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device.device_id)},
-            "name": device.name,
-            "manufacturer": device.manufacturer,
-            "model": device.product_id,
-            "via_device": (DOMAIN, gateway.gateway_id),
-        }
-
-    async def async_added_to_hass(self) -> None:
-        """Handle entity addition to Home Assistant."""
-
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.PROPERTY_UPDATE, self._handle_device_update
-            )
-        )
-
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.ONLINE_STATUS, self._handle_availability
-            )
-        )
-
-        await self._gateway.get_device_properties(
-            self._device.device_id,
-            ["OccupancyState"],
-        )
-
-        _LOGGER.debug(
-            "Requested initial properties for occupancy sensor %s",
-            self._device.device_id,
-        )
 
     @callback
     def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
-        if dev_id != self._device.device_id:
+        occupancy = status.get(PROPERTY_OCCUPANCY_STATE)
+        if occupancy is None:
             return
 
-        if "OccupancyState" in status:
-            self._attr_is_on = status["OccupancyState"]["value"] == 1
-
-        self.schedule_update_ha_state()
-
-    @callback
-    def _handle_availability(self, dev_id: str, available: bool) -> None:
-        if dev_id not in (self._device.device_id, self._gateway.gateway_id):
+        is_on = occupancy["value"] == 1
+        if self._attr_is_on == is_on:
             return
 
-        self._attr_available = available
-        self.schedule_update_ha_state()
+        self._attr_is_on = is_on
+        self.async_write_ha_state()
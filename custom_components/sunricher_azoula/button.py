@@ -11,9 +11,9 @@ from homeassistant.components.button import (
 )
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
 from .sdk.device import AzoulaDevice
 from .sdk.gateway import AzoulaGateway
 from .types import AzoulaSmartConfigEntry
@@ -33,10 +33,13 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Azoula Smart buttons from a config entry."""
+    data = entry.runtime_data
     async_add_entities(
         [
-            AzoulaIdentifyButton(device, entry.runtime_data.gateway)
-            for device in entry.runtime_data.devices
+            AzoulaIdentifyButton(
+                device, data.gateway, data.device_info[device.device_id]
+            )
+            for device in data.devices
             if device.has_identify_support()
         ]
     )
@@ -48,18 +51,14 @@ class AzoulaIdentifyButton(ButtonEntity):
     _attr_has_entity_name = True
     entity_description = IDENTIFY_BUTTON_DESCRIPTION
 
-    def __init__(self, device: AzoulaDevice, gateway: AzoulaGateway) -> None:
+    def __init__(
+        self, device: AzoulaDevice, gateway: AzoulaGateway, device_info: DeviceInfo
+    ) -> None:
         """Initialize the button entity."""
         self._device = device
         self._gateway = gateway
         self._attr_unique_id = f"{device.device_id}-identify"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device.device_id)},
-            "name": device.name,
-            "manufacturer": device.manufacturer,
-            "model": device.product_id,
-            "via_device": (DOMAIN, gateway.gateway_id),
-        }
+        self._attr_device_info = device_info
 
     async def async_press(self) -> None:
         """Press the button to identify the device."""
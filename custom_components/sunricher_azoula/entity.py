@@ -0,0 +1,88 @@
+"""Base entity for the Azoula Smart Hub integration."""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
+
+from .sdk.const import CallbackEventType
+from .sdk.device import AzoulaDevice
+from .sdk.gateway import AzoulaGateway
+from .sdk.types import PropertyParams
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AzoulaEntity(Entity):
+    """Base class for entities backed by a device on an Azoula gateway."""
+
+    _attr_has_entity_name = True
+    _required_properties: tuple[str, ...] = ()
+
+    def __init__(
+        self, device: AzoulaDevice, gateway: AzoulaGateway, device_info: DeviceInfo
+    ) -> None:
+        """Initialize the entity."""
+        self._device = device
+        self._gateway = gateway
+        self._attr_available = device.online
+        self._attr_device_info = device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Register gateway listeners and request the initial state."""
+        device_id = self._device.device_id
+        gateway = self._gateway
+
+        # Availability follows both the device and the gateway it is paired to.
+        removers = (
+            gateway.register_listener(
+                CallbackEventType.PROPERTY_UPDATE,
+                self._handle_device_update,
+                device_id=device_id,
+            ),
+            gateway.register_listener(
+                CallbackEventType.ONLINE_STATUS,
+                self._handle_availability,
+                device_id=device_id,
+            ),
+            gateway.register_listener(
+                CallbackEventType.ONLINE_STATUS,
+                self._handle_availability,
+                device_id=gateway.gateway_id,
+            ),
+        )
+
+        @callback
+        def _remove_listeners() -> None:
+            for remove in removers:
+                remove()
+
+        self.async_on_remove(_remove_listeners)
+
+        if self._required_properties:
+            await gateway.get_device_properties(device_id, self._required_properties)
+
+            _LOGGER.debug(
+                "Requested initial properties for %s: %s",
+                device_id,
+                self._required_properties,
+            )
+
+    @callback
+    def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
+        """Handle a property update reported for this device.
+
+        Entities that track device properties override this. The base
+        implementation ignores the update.
+        """
+
+    @callback
+    def _handle_availability(self, dev_id: str, available: bool) -> None:
+        if self._attr_available == available:
+            return
+
+        self._attr_available = available
+        self.async_write_ha_state()
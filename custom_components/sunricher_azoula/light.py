@@ -15,17 +15,24 @@ from homeassistant.components.light import (
 )
 from homeassistant.components.light.const import ColorMode
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .entity import AzoulaEntity
 from .sdk.const import (
+    PROPERTY_COLOR_TEMPERATURE,
+    PROPERTY_CURRENT_HUE,
+    PROPERTY_CURRENT_LEVEL,
+    PROPERTY_CURRENT_SATURATION,
+    PROPERTY_CURRENT_X,
+    PROPERTY_CURRENT_Y,
+    PROPERTY_ON_OFF,
     SERVICE_COLOR_MOVE_TO_COLOR,
     SERVICE_COLOR_MOVE_TO_HUE_AND_SATURATION,
     SERVICE_COLOR_TEMP_MOVE_TO_COLOR_TEMP,
     SERVICE_LEVEL_MOVE_TO_LEVEL_WITH_ONOFF,
     SERVICE_ONOFF_OFF,
     SERVICE_ONOFF_ON,
-    CallbackEventType,
 )
 from .sdk.device import AzoulaDevice
 from .sdk.gateway import AzoulaGateway
@@ -34,6 +41,23 @@ from .types import AzoulaSmartConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Transition time sent with every light command, in 0.1s units
+DEFAULT_TRANSITION_TIME = 10
+
+# Supported color modes and initial color mode for each kind of light. Lights
+# of the same kind share these objects instead of building their own sets.
+_COLOR_MODES_HS_COLOR_TEMP = ({ColorMode.HS, ColorMode.COLOR_TEMP}, ColorMode.HS)
+_COLOR_MODES_XY_COLOR_TEMP = ({ColorMode.XY, ColorMode.COLOR_TEMP}, ColorMode.XY)
+_COLOR_MODES_HS = ({ColorMode.HS}, ColorMode.HS)
+_COLOR_MODES_COLOR_TEMP = ({ColorMode.COLOR_TEMP}, ColorMode.COLOR_TEMP)
+_COLOR_MODES_XY = ({ColorMode.XY}, ColorMode.XY)
+_COLOR_MODES_BRIGHTNESS = ({ColorMode.BRIGHTNESS}, ColorMode.BRIGHTNESS)
+_COLOR_MODES_ONOFF = ({ColorMode.ONOFF}, ColorMode.ONOFF)
+
+# Conversions between Home Assistant brightness (0-254) and device level (0-100)
+_BRIGHTNESS_TO_LEVEL = tuple(round(i * 100 / 254) for i in range(255))
+_LEVEL_TO_BRIGHTNESS = tuple(int(i * 254 / 100) for i in range(101))
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,19 +65,20 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Azoula Smart lights from a config entry."""
+    data = entry.runtime_data
     async_add_entities(
         [
-            AzoulaLight(device, entry.runtime_data.gateway)
-            for device in entry.runtime_data.devices
-            if device.has_property("OnOff")
+            AzoulaLight(device, data.gateway, data.device_info[device.device_id])
+            for device in data.devices
+            if device.has_property(PROPERTY_ON_OFF)
         ]
     )
 
 
-class AzoulaLight(LightEntity):
+class AzoulaLight(AzoulaEntity, LightEntity):
     """Representation of an Azoula Smart light."""
 
-    _attr_has_entity_name = True
+    _attr_name = "Light"
     _attr_is_on: bool | None = None
     _attr_brightness: int | None = None
     _attr_color_mode: ColorMode | str | None = None
@@ -64,87 +89,59 @@ class AzoulaLight(LightEntity):
     _attr_max_color_temp_kelvin = 6250
     _attr_min_color_temp_kelvin = 2222
 
-    def __init__(self, device: AzoulaDevice, gateway: AzoulaGateway) -> None:
+    def __init__(
+        self, device: AzoulaDevice, gateway: AzoulaGateway, device_info: DeviceInfo
+    ) -> None:
         """Initialize the light entity."""
-        self._device = device
-        self._gateway = gateway
-        self._attr_name = "Light"
+        super().__init__(device, gateway, device_info)
         self._attr_unique_id = f"{device.device_id}-light"
-        self._attr_available = device.online
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device.device_id)},
-            "name": device.name,
-            "manufacturer": device.manufacturer,
-            "model": device.product_id,
-            "via_device": (DOMAIN, gateway.gateway_id),
-        }
 
         self._determine_features()
 
     def _determine_features(self) -> None:
         """Determine supported color modes based on device TSL properties."""
-        supported_modes: set[ColorMode] = set()
-
         # Check device properties from TSL to determine color modes
-        has_color_temp = self._device.has_property("ColorTemperature")
-        has_xy = self._device.has_property("CurrentX") and self._device.has_property(
-            "CurrentY"
+        device = self._device
+        has_color_temp = device.has_property(PROPERTY_COLOR_TEMPERATURE)
+        has_xy = device.has_property(PROPERTY_CURRENT_X) and device.has_property(
+            PROPERTY_CURRENT_Y
         )
-        has_hs = self._device.has_property("CurrentHue") and self._device.has_property(
-            "CurrentSaturation"
+        has_hs = device.has_property(PROPERTY_CURRENT_HUE) and device.has_property(
+            PROPERTY_CURRENT_SATURATION
         )
-        has_brightness = self._device.has_property("CurrentLevel")
+        has_brightness = device.has_property(PROPERTY_CURRENT_LEVEL)
 
         if has_hs and has_color_temp:
-            supported_modes.add(ColorMode.HS)
-            supported_modes.add(ColorMode.COLOR_TEMP)
-            self._attr_color_mode = ColorMode.HS
+            color_modes = _COLOR_MODES_HS_COLOR_TEMP
         elif has_xy and has_color_temp:
-            supported_modes.add(ColorMode.XY)
-            supported_modes.add(ColorMode.COLOR_TEMP)
-            self._attr_color_mode = ColorMode.XY
+            color_modes = _COLOR_MODES_XY_COLOR_TEMP
         elif has_hs:
-            supported_modes.add(ColorMode.HS)
-            self._attr_color_mode = ColorMode.HS
+            color_modes = _COLOR_MODES_HS
         elif has_color_temp:
-            supported_modes.add(ColorMode.COLOR_TEMP)
-            self._attr_color_mode = ColorMode.COLOR_TEMP
+            color_modes = _COLOR_MODES_COLOR_TEMP
         elif has_xy:
-            supported_modes.add(ColorMode.XY)
-            self._attr_color_mode = ColorMode.XY
+            color_modes = _COLOR_MODES_XY
         elif has_brightness:
-            supported_modes.add(ColorMode.BRIGHTNESS)
-            self._attr_color_mode = ColorMode.BRIGHTNESS
+            color_modes = _COLOR_MODES_BRIGHTNESS
         else:
             # OnOff only
-            supported_modes.add(ColorMode.ONOFF)
-            self._attr_color_mode = ColorMode.ONOFF
+            color_modes = _COLOR_MODES_ONOFF
 
+        supported_modes, self._attr_color_mode = color_modes
         self._attr_supported_color_modes = supported_modes
-
-    def _get_required_properties(self) -> list[str]:
-        """Get list of properties to fetch based on device capabilities."""
-        properties = ["OnOff", "CurrentLevel"]
-
-        if (
-            self._attr_supported_color_modes
-            and ColorMode.COLOR_TEMP in self._attr_supported_color_modes
-        ):
-            properties.append("ColorTemperature")
-
-        if (
-            self._attr_supported_color_modes
-            and ColorMode.HS in self._attr_supported_color_modes
-        ):
-            properties.extend(["CurrentHue", "CurrentSaturation"])
-
-        if (
-            self._attr_supported_color_modes
-            and ColorMode.XY in self._attr_supported_color_modes
-        ):
-            properties.extend(["CurrentX", "CurrentY"])
-
-        return properties
+        self._supports_color_temp = ColorMode.COLOR_TEMP in supported_modes
+        self._supports_hs = ColorMode.HS in supported_modes
+        self._supports_xy = ColorMode.XY in supported_modes
+
+        # Properties to fetch based on device capabilities
+        properties = [PROPERTY_ON_OFF, PROPERTY_CURRENT_LEVEL]
+        if self._supports_color_temp:
+            properties.append(PROPERTY_COLOR_TEMPERATURE)
+        if self._supports_hs:
+            properties.extend((PROPERTY_CURRENT_HUE, PROPERTY_CURRENT_SATURATION))
+        if self._supports_xy:
+            properties.extend((PROPERTY_CURRENT_X, PROPERTY_CURRENT_Y))
+        self._required_properties = tuple(properties)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
@@ -166,18 +163,14 @@ class AzoulaLight(LightEntity):
         )
 
         if color_temp_kelvin is not None:
-            color_temp = int(color_temp_kelvin)
-            min_temp = self._attr_min_color_temp_kelvin
-            max_temp = self._attr_max_color_temp_kelvin
-
-            if min_temp is not None and color_temp < min_temp:
-                color_temp = min_temp
-            if max_temp is not None and color_temp > max_temp:
-                color_temp = max_temp
+            color_temp = min(
+                self._attr_max_color_temp_kelvin,
+                max(self._attr_min_color_temp_kelvin, int(color_temp_kelvin)),
+            )
 
             params = {
                 "ColorTemperature": color_temp,
-                "TransitionTime": 10,
+                "TransitionTime": DEFAULT_TRANSITION_TIME,
             }
             await self._gateway.invoke_service(
                 self._device.device_id,
@@ -186,13 +179,13 @@ class AzoulaLight(LightEntity):
             )
 
         if hs_color is not None:
+            # The light service schema already limits hue to 0-360 and
+            # saturation to 0-100.
             hue, saturation = hs_color
-            clamped_hue = max(0, min(360, int(hue)))
-            clamped_saturation = max(0, min(100, int(saturation)))
             params = {
-                "Hue": clamped_hue,
-                "Saturation": clamped_saturation,
-                "TransitionTime": 10,
+                "Hue": int(hue),
+                "Saturation": int(saturation),
+                "TransitionTime": DEFAULT_TRANSITION_TIME,
             }
             await self._gateway.invoke_service(
                 self._device.device_id,
@@ -207,7 +200,7 @@ class AzoulaLight(LightEntity):
             params = {
                 "ColorX": round(clamped_x, 3),
                 "ColorY": round(clamped_y, 3),
-                "TransitionTime": 10,
+                "TransitionTime": DEFAULT_TRANSITION_TIME,
             }
             await self._gateway.invoke_service(
                 self._device.device_id,
@@ -216,10 +209,10 @@ class AzoulaLight(LightEntity):
             )
 
         if brightness is not None:
-            level = max(0, min(254, int(brightness)))
+            level = _BRIGHTNESS_TO_LEVEL[max(0, min(254, int(brightness)))]
             params = {
-                "Level": int(round(level * 100 / 254)),
-                "TransitionTime": 10,
+                "Level": level,
+                "TransitionTime": DEFAULT_TRANSITION_TIME,
             }
 
             await self._gateway.invoke_service(
@@ -228,7 +221,10 @@ class AzoulaLight(LightEntity):
                 params,
             )
 
-        # No parameters provided, just turn on
+            # Moving to a non-zero level with on/off already turns the light on.
+            if level > 0:
+                return
+
         await self._gateway.invoke_service(
             self._device.device_id,
             SERVICE_ONOFF_ON,
@@ -242,89 +238,62 @@ class AzoulaLight(LightEntity):
             self._device.device_id,
             SERVICE_ONOFF_OFF,
         )
+
+        # The gateway is not guaranteed to post OnOff after the command, so
+        # show the light off right away. A confirming post changes nothing.
         self._attr_is_on = False
         self.async_write_ha_state()
 
-    async def async_added_to_hass(self) -> None:
-        """Handle entity addition to Home Assistant."""
-
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.PROPERTY_UPDATE, self._handle_device_update
-            )
-        )
-
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.ONLINE_STATUS, self._handle_availability
-            )
-        )
-
-        properties = self._get_required_properties()
-        await self._gateway.get_device_properties(
-            self._device.device_id,
-            properties,
-        )
-
-        _LOGGER.debug(
-            "Requested initial properties for light %s: %s",
-            self._device.device_id,
-            properties,
-        )
-
     @callback
     def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
-        if dev_id != self._device.device_id:
-            return
-
-        if "OnOff" in status:
-            self._attr_is_on = status["OnOff"]["value"] == 1
-
-        if "CurrentLevel" in status:
-            level = status["CurrentLevel"]["value"]
-            self._attr_brightness = int(level * 254 / 100)
-
-        if "ColorTemperature" in status:
-            color_temp = status["ColorTemperature"]["value"]
-            self._attr_color_temp_kelvin = int(color_temp)
-            if (
-                self._attr_supported_color_modes
-                and ColorMode.COLOR_TEMP in self._attr_supported_color_modes
-            ):
+        previous_state = self._state_snapshot()
+
+        if (on_off := status.get(PROPERTY_ON_OFF)) is not None:
+            self._attr_is_on = on_off["value"] == 1
+
+        if (current_level := status.get(PROPERTY_CURRENT_LEVEL)) is not None:
+            level = current_level["value"]
+            if isinstance(level, int) and 0 <= level <= 100:
+                self._attr_brightness = _LEVEL_TO_BRIGHTNESS[level]
+            else:
+                # Levels outside the table are converted as reported, not clamped.
+                self._attr_brightness = int(level * 254 / 100)
+
+        # Colors are applied in order of precedence, so when one update
+        # reports several, XY wins over HS over color temperature.
+        if (color_temp := status.get(PROPERTY_COLOR_TEMPERATURE)) is not None:
+            self._attr_color_temp_kelvin = int(color_temp["value"])
+            if self._supports_color_temp:
                 self._attr_color_mode = ColorMode.COLOR_TEMP
 
-        current_hue = status.get("CurrentHue")
-        current_saturation = status.get("CurrentSaturation")
+        current_hue = status.get(PROPERTY_CURRENT_HUE)
+        current_saturation = status.get(PROPERTY_CURRENT_SATURATION)
         if current_hue is not None and current_saturation is not None:
             self._attr_hs_color = (
                 float(current_hue["value"]),
                 float(current_saturation["value"]),
             )
-            if (
-                self._attr_supported_color_modes
-                and ColorMode.HS in self._attr_supported_color_modes
-            ):
+            if self._supports_hs:
                 self._attr_color_mode = ColorMode.HS
 
-        current_x = status.get("CurrentX")
-        current_y = status.get("CurrentY")
+        current_x = status.get(PROPERTY_CURRENT_X)
+        current_y = status.get(PROPERTY_CURRENT_Y)
         if current_x is not None and current_y is not None:
-            self._attr_xy_color = (
-                float(current_x["value"]),
-                float(current_y["value"]),
-            )
-            if (
-                self._attr_supported_color_modes
-                and ColorMode.XY in self._attr_supported_color_modes
-            ):
+            self._attr_xy_color = (float(current_x["value"]), float(current_y["value"]))
+            if self._supports_xy:
                 self._attr_color_mode = ColorMode.XY
 
-        self.schedule_update_ha_state()
-
-    @callback
-    def _handle_availability(self, dev_id: str, available: bool) -> None:
-        if dev_id not in (self._device.device_id, self._gateway.gateway_id):
-            return
-
-        self._attr_available = available
-        self.schedule_update_ha_state()
+        # Gateways re-post unchanged properties, so only write real changes.
+        if self._state_snapshot() != previous_state:
+            self.async_write_ha_state()
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return the attributes that make up the light's state."""
+        return (
+            self._attr_is_on,
+            self._attr_brightness,
+            self._attr_color_mode,
+            self._attr_color_temp_kelvin,
+            self._attr_hs_color,
+            self._attr_xy_color,
+        )
@@ -7,10 +7,10 @@ import logging
 from homeassistant.components.number import NumberDeviceClass, NumberEntity, NumberMode
 from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
-from .sdk.const import CallbackEventType
+from .entity import AzoulaEntity
 from .sdk.device import AzoulaDevice
 from .sdk.gateway import AzoulaGateway
 from .sdk.types import PropertyParams
@@ -29,52 +29,72 @@ async def async_setup_entry(
 
     for device in entry.runtime_data.devices:
         gateway = entry.runtime_data.gateway
+        device_info = entry.runtime_data.device_info[device.device_id]
 
         # MinLevel entities
         if device.has_property("MinLevelSet"):
-            entities.append(AzoulaMinLevelNumber(device, gateway, "MinLevelSet"))
+            entities.append(
+                AzoulaMinLevelNumber(device, gateway, device_info, "MinLevelSet")
+            )
         elif device.has_property("LevelControlMinLevel"):
             entities.append(
-                AzoulaMinLevelNumber(device, gateway, "LevelControlMinLevel")
+                AzoulaMinLevelNumber(
+                    device, gateway, device_info, "LevelControlMinLevel"
+                )
             )
 
         # MaxLevel entities
         if device.has_property("LevelControlMaxLevel"):
-            entities.append(AzoulaMaxLevelNumber(device, gateway))
+            entities.append(AzoulaMaxLevelNumber(device, gateway, device_info))
 
         # Transition time entities
         if device.has_property("OnOffTransitionTime"):
             entities.append(
                 AzoulaTransitionTimeNumber(
-                    device, gateway, "OnOffTransitionTime", "On/Off Transition Time"
+                    device,
+                    gateway,
+                    device_info,
+                    "OnOffTransitionTime",
+                    "On/Off Transition Time",
                 )
             )
         if device.has_property("OnTransitionTime"):
             entities.append(
                 AzoulaTransitionTimeNumber(
-                    device, gateway, "OnTransitionTime", "On Transition Time"
+                    device,
+                    gateway,
+                    device_info,
+                    "OnTransitionTime",
+                    "On Transition Time",
                 )
             )
         if device.has_property("OffTransitionTime"):
             entities.append(
                 AzoulaTransitionTimeNumber(
-                    device, gateway, "OffTransitionTime", "Off Transition Time"
+                    device,
+                    gateway,
+                    device_info,
+                    "OffTransitionTime",
+                    "Off Transition Time",
                 )
             )
 
         # Sensor configuration entities
         if device.has_property("IlluminanceThreshold"):
-            entities.append(AzoulaIlluminanceThresholdNumber(device, gateway))
+            entities.append(
+                AzoulaIlluminanceThresholdNumber(device, gateway, device_info)
+            )
         if device.has_property("OccupancyDetectionArea"):
-            entities.append(AzoulaOccupancyDetectionAreaNumber(device, gateway))
+            entities.append(
+                AzoulaOccupancyDetectionAreaNumber(device, gateway, device_info)
+            )
 
     async_add_entities(entities)
 
 
-class AzoulaNumberEntity(NumberEntity):
+class AzoulaNumberEntity(AzoulaEntity, NumberEntity):
     """Base class for Azoula number entities."""
 
-    _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
     _attr_native_value: float | None = None
     _property_identifier: str
@@ -83,20 +103,25 @@ class AzoulaNumberEntity(NumberEntity):
         self,
         device: AzoulaDevice,
         gateway: AzoulaGateway,
+        device_info: DeviceInfo,
         property_identifier: str,
     ) -> None:
         """Initialize the number entity."""
-        self._device = device
-        self._gateway = gateway
+        super().__init__(device, gateway, device_info)
         self._property_identifier = property_identifier
-        self._attr_available = device.online
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device.device_id)},
-            "name": device.name,
-            "manufacturer": device.manufacturer,
-            "model": device.product_id,
-            "via_device": (DOMAIN, gateway.gateway_id),
-        }
+
+        # Only request an initial value if the property is readable.
+        prop_spec = device.get_property_spec(property_identifier)
+        access_mode = prop_spec.get("accessMode", "r") if prop_spec else "r"
+        if access_mode in ("r", "rw"):
+            self._required_properties = (property_identifier,)
+        else:
+            _LOGGER.debug(
+                "Skipping initial property request for %s (accessMode=%s) on device %s",
+                property_identifier,
+                access_mode,
+                device.device_id,
+            )
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
@@ -113,62 +138,6 @@ class AzoulaNumberEntity(NumberEntity):
             {self._property_identifier: int_value},
         )
 
-    async def async_added_to_hass(self) -> None:
-        """Handle entity addition to Home Assistant."""
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.PROPERTY_UPDATE, self._handle_device_update
-            )
-        )
-
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.ONLINE_STATUS, self._handle_availability
-            )
-        )
-
-        # Request initial property value only if property is readable
-        prop_spec = self._device.get_property_spec(self._property_identifier)
-        access_mode = prop_spec.get("accessMode", "r") if prop_spec else "r"
-
-        if access_mode in ("r", "rw"):
-            await self._gateway.get_device_properties(
-                self._device.device_id,
-                [self._property_identifier],
-            )
-
-            _LOGGER.debug(
-                "Requested initial property %s for device %s",
-                self._property_identifier,
-                self._device.device_id,
-            )
-        else:
-            _LOGGER.debug(
-                "Skipping initial property request for %s (accessMode=%s) on device %s",
-                self._property_identifier,
-                access_mode,
-                self._device.device_id,
-            )
-
-    @callback
-    def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
-        """Handle device property update.
-
-        Subclasses should override this method to handle specific properties.
-        """
-        # Base implementation does nothing - subclasses must override
-        _ = dev_id
-        _ = status
-
-    @callback
-    def _handle_availability(self, dev_id: str, available: bool) -> None:
-        """Handle device availability update."""
-        if dev_id not in (self._device.device_id, self._gateway.gateway_id):
-            return
-
-        self._attr_available = available
-        self.schedule_update_ha_state()
-
 
 class AzoulaMinLevelNumber(AzoulaNumberEntity):
     """Number entity for minimum brightness level setting."""
@@ -177,10 +146,11 @@ class AzoulaMinLevelNumber(AzoulaNumberEntity):
         self,
         device: AzoulaDevice,
         gateway: AzoulaGateway,
+        device_info: DeviceInfo,
         property_identifier: str,
     ) -> None:
         """Initialize the min level number entity."""
-        super().__init__(device, gateway, property_identifier)
+        super().__init__(device, gateway, device_info, property_identifier)
         self._attr_name = "Minimum Brightness"
         self._attr_unique_id = f"{device.device_id}-min-level"
         self._attr_native_min_value = 0
@@ -192,29 +162,28 @@ class AzoulaMinLevelNumber(AzoulaNumberEntity):
     @callback
     def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
         """Handle device property update."""
-        if dev_id != self._device.device_id:
-            return
-
         # Check for MinLevelSet or LevelControlMinLevel based on property_identifier
         if self._property_identifier == "MinLevelSet" and "MinLevelSet" in status:
             value = status["MinLevelSet"]["value"]
             self._attr_native_value = float(value)
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
         elif (
             self._property_identifier == "LevelControlMinLevel"
             and "LevelControlMinLevel" in status
         ):
             value = status["LevelControlMinLevel"]["value"]
             self._attr_native_value = float(value)
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
 
 
 class AzoulaMaxLevelNumber(AzoulaNumberEntity):
     """Number entity for maximum brightness level setting."""
 
-    def __init__(self, device: AzoulaDevice, gateway: AzoulaGateway) -> None:
+    def __init__(
+        self, device: AzoulaDevice, gateway: AzoulaGateway, device_info: DeviceInfo
+    ) -> None:
         """Initialize the max level number entity."""
-        super().__init__(device, gateway, "LevelControlMaxLevel")
+        super().__init__(device, gateway, device_info, "LevelControlMaxLevel")
         self._attr_name = "Maximum Brightness"
         self._attr_unique_id = f"{device.device_id}-max-level"
         self._attr_native_min_value = 0
@@ -226,13 +195,10 @@ class AzoulaMaxLevelNumber(AzoulaNumberEntity):
     @callback
     def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
         """Handle device property update."""
-        if dev_id != self._device.device_id:
-            return
-
         if "LevelControlMaxLevel" in status:
             value = status["LevelControlMaxLevel"]["value"]
             self._attr_native_value = float(value)
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
 
 
 class AzoulaTransitionTimeNumber(AzoulaNumberEntity):
@@ -246,11 +212,12 @@ class AzoulaTransitionTimeNumber(AzoulaNumberEntity):
         self,
         device: AzoulaDevice,
         gateway: AzoulaGateway,
+        device_info: DeviceInfo,
         property_identifier: str,
         name: str,
     ) -> None:
         """Initialize the transition time number entity."""
-        super().__init__(device, gateway, property_identifier)
+        super().__init__(device, gateway, device_info, property_identifier)
         self._attr_name = name
         self._attr_unique_id = (
             f"{device.device_id}-{property_identifier.lower().replace('_', '-')}"
@@ -287,9 +254,6 @@ class AzoulaTransitionTimeNumber(AzoulaNumberEntity):
     @callback
     def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
         """Handle device property update."""
-        if dev_id != self._device.device_id:
-            return
-
         # Check each possible transition time property explicitly
         raw_value: float | None = None
         if (
@@ -311,15 +275,17 @@ class AzoulaTransitionTimeNumber(AzoulaNumberEntity):
         if raw_value is not None:
             # Convert from 0.1s units to seconds for display
             self._attr_native_value = raw_value / 10.0
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
 
 
 class AzoulaIlluminanceThresholdNumber(AzoulaNumberEntity):
     """Number entity for illuminance threshold setting."""
 
-    def __init__(self, device: AzoulaDevice, gateway: AzoulaGateway) -> None:
+    def __init__(
+        self, device: AzoulaDevice, gateway: AzoulaGateway, device_info: DeviceInfo
+    ) -> None:
         """Initialize the illuminance threshold number entity."""
-        super().__init__(device, gateway, "IlluminanceThreshold")
+        super().__init__(device, gateway, device_info, "IlluminanceThreshold")
         self._attr_name = "Illuminance Threshold"
         self._attr_unique_id = f"{device.device_id}-illuminance-threshold"
         self._attr_native_min_value = 0
@@ -333,21 +299,20 @@ class AzoulaIlluminanceThresholdNumber(AzoulaNumberEntity):
     @callback
     def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
         """Handle device property update."""
-        if dev_id != self._device.device_id:
-            return
-
         if "IlluminanceThreshold" in status:
             value = status["IlluminanceThreshold"]["value"]
             self._attr_native_value = float(value)
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
 
 
 class AzoulaOccupancyDetectionAreaNumber(AzoulaNumberEntity):
     """Number entity for occupancy detection area setting."""
 
-    def __init__(self, device: AzoulaDevice, gateway: AzoulaGateway) -> None:
+    def __init__(
+        self, device: AzoulaDevice, gateway: AzoulaGateway, device_info: DeviceInfo
+    ) -> None:
         """Initialize the occupancy detection area number entity."""
-        super().__init__(device, gateway, "OccupancyDetectionArea")
+        super().__init__(device, gateway, device_info, "OccupancyDetectionArea")
         self._attr_name = "Detection Area"
         self._attr_unique_id = f"{device.device_id}-occupancy-detection-area"
         self._attr_native_min_value = 0
@@ -360,10 +325,7 @@ class AzoulaOccupancyDetectionAreaNumber(AzoulaNumberEntity):
     @callback
     def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
         """Handle device property update."""
-        if dev_id != self._device.device_id:
-            return
-
         if "OccupancyDetectionArea" in status:
             value = status["OccupancyDetectionArea"]["value"]
             self._attr_native_value = float(value)
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
@@ -7,70 +7,75 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .device import AzoulaDevice
 
+# Property identifiers that map to each Home Assistant platform
+LIGHT_PROPERTIES = frozenset(
+    {
+        "OnOff",
+        "CurrentLevel",
+        "ColorTemperature",
+        "CurrentHue",
+        "CurrentSaturation",
+        "CurrentX",
+        "CurrentY",
+    }
+)
+SENSOR_PROPERTIES = frozenset(
+    {
+        "IllumMeasuredValue",
+        "Temperature",
+        "Humidity",
+        "CurrentSummationDelivered",
+        "ActivePower_User",
+    }
+)
+BINARY_SENSOR_PROPERTIES = frozenset(
+    {
+        "OccupancyState",
+        "MotionSensorIntrusionIndication",
+    }
+)
+NUMBER_PROPERTIES = frozenset(
+    {
+        "MinLevelSet",
+        "LevelControlMinLevel",
+        "LevelControlMaxLevel",
+        "OnOffTransitionTime",
+        "OnTransitionTime",
+        "OffTransitionTime",
+        "IlluminanceThreshold",
+        "OccupancyDetectionArea",
+    }
+)
+SELECT_PROPERTIES = frozenset({"StartUpOnOff"})
+SWITCH_PROPERTIES = frozenset({"OccupancyLEDStatus"})
+
+_PLATFORM_PROPERTIES = (
+    ("light", LIGHT_PROPERTIES),
+    ("sensor", SENSOR_PROPERTIES),
+    ("binary_sensor", BINARY_SENSOR_PROPERTIES),
+    ("number", NUMBER_PROPERTIES),
+    ("select", SELECT_PROPERTIES),
+    ("switch", SWITCH_PROPERTIES),
+)
+
 
 class CapabilityDetector:
     """Detects device capabilities based on TSL properties."""
 
     @staticmethod
-    def get_required_platforms(device: AzoulaDevice) -> set[str]:
-        """Get required Home Assistant platforms based on device TSL properties."""
-        if not device.tsl:
-            return set()
-
-        platforms: set[str] = set()
-        properties = device.tsl.get("properties", [])
-
-        for prop in properties:
-            identifier = prop.get("identifier", "")
-
-            # Light properties
-            if identifier in (
-                "OnOff",
-                "CurrentLevel",
-                "ColorTemperature",
-                "CurrentHue",
-                "CurrentSaturation",
-                "CurrentX",
-                "CurrentY",
-            ):
-                platforms.add("light")
-
-            # Sensor properties
-            if identifier in (
-                "IllumMeasuredValue",
-                "Temperature",
-                "Humidity",
-                "CurrentSummationDelivered",
-                "ActivePower_User",
-            ):
-                platforms.add("sensor")
-
-            # Binary sensor properties
-            if identifier in (
-                "OccupancyState",
-                "MotionSensorIntrusionIndication",
-            ):
-                platforms.add("binary_sensor")
-
-            # Number properties (configuration entities)
-            if identifier in (
-                "MinLevelSet",
-                "LevelControlMinLevel",
-                "LevelControlMaxLevel",
-                "OnOffTransitionTime",
-                "OnTransitionTime",
-                "OffTransitionTime",
-                "IlluminanceThreshold",
-                "OccupancyDetectionArea",
-            ):
-                platforms.add("number")
-
-            # Select properties
-            if identifier == "StartUpOnOff":
-                platforms.add("select")
+    def get_required_platforms(device: AzoulaDevice) -> frozenset[str]:
+        """Get required Home Assistant platforms based on device TSL properties.
 
-            # Switch properties
-            if identifier == "OccupancyLEDStatus":
-                platforms.add("switch")
+        The result is cached on the device until its TSL is reloaded.
+        """
+        if (platforms := device.required_platforms) is not None:
+            return platforms
 
+        identifiers = device.property_identifiers
+        platforms = frozenset(
+            platform
+            for platform, properties in _PLATFORM_PROPERTIES
+            if not identifiers.isdisjoint(properties)
+        )
+        device.required_platforms = platforms
         return platforms
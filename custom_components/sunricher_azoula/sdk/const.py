@@ -1,6 +1,7 @@
 """Constants for the Dali Center."""
 
 from enum import Enum
+from typing import Final
 
 # MQTT Topics
 TOPIC_GATEWAY_PREFIX = "meribee/gateway"
@@ -10,6 +11,15 @@ TOPIC_PLATFORM_APP_PREFIX = "meribee/platform-app"
 DEFAULT_MQTT_PORT = 1883
 DEFAULT_DISCOVERY_TIMEOUT = 30.0  # seconds
 DEFAULT_TSL_TIMEOUT = 10.0  # seconds
+DEFAULT_PROPERTY_GET_BATCH_WINDOW = 0.05  # seconds
+DEFAULT_PROPERTY_UPDATE_WINDOW = 0.02  # seconds
+DEFAULT_RECONNECT_MIN_DELAY = 1.0  # seconds
+DEFAULT_RECONNECT_MAX_DELAY = 120.0  # seconds
+MQTT_MISC_INTERVAL = 1.0  # seconds
+MAX_CONCURRENT_LISTENER_TASKS = 64
+MAX_CONCURRENT_TSL_REQUESTS = 8
+MAX_PENDING_MESSAGES = 4096
+MQTT_SOCKET_RECEIVE_BUFFER_SIZE = 2 * 1024 * 1024  # bytes
 
 # TSL language options
 TSL_LANGUAGE_ENGLISH = "english"
@@ -28,6 +38,16 @@ METHOD_PROPERTY_SET_REPLY = "thing.service.property.set.reply"
 METHOD_TSL_GET = "thing.tsl"
 METHOD_TSL_GET_REPLY = "thing.tsl.reply"
 
+# Property identifiers
+PROPERTY_ON_OFF: Final = "OnOff"
+PROPERTY_CURRENT_LEVEL: Final = "CurrentLevel"
+PROPERTY_COLOR_TEMPERATURE: Final = "ColorTemperature"
+PROPERTY_CURRENT_HUE: Final = "CurrentHue"
+PROPERTY_CURRENT_SATURATION: Final = "CurrentSaturation"
+PROPERTY_CURRENT_X: Final = "CurrentX"
+PROPERTY_CURRENT_Y: Final = "CurrentY"
+PROPERTY_OCCUPANCY_STATE: Final = "OccupancyState"
+
 # Property service identifiers
 SERVICE_PROPERTY_GET = "get"
 SERVICE_PROPERTY_SET = "set"
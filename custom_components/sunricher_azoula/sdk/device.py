@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
+from collections.abc import KeysView
 from dataclasses import dataclass, field
+from operator import itemgetter
+import sys
 from typing import TYPE_CHECKING, Any
 
-from .const import SERVICE_DEVICE_IDENTIFY
+from .const import SERVICE_DEVICE_IDENTIFY, SERVICE_PROPERTY_GET
 
 if TYPE_CHECKING:
     from .types import DeviceTSL, TSLProperty, TSLService
 
+# Top-level discovery fields, in constructor order
+_DEVICE_FIELDS = itemgetter(
+    "deviceID",
+    "profile",
+    "deviceType",
+    "productId",
+    "online",
+    "protocol",
+    "manufacturer",
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class AzoulaDevice:
     """Unified device model under the Azoula gateway.
 
     The TSL (Thing Specification Language) defines device capabilities
-    and determines which Home Assistant entities should be created.
+    and determines which Home Assistant entities should be created. Attach
+    it with ``load_tsl`` so capability lookups stay in sync.
     """
 
     name: str
@@ -30,18 +45,49 @@ class AzoulaDevice:
     tsl: DeviceTSL | None = None
     properties: dict[str, Any] = field(default_factory=lambda: {})
 
+    # TSL lookups by identifier, rebuilt by load_tsl
+    _tsl_properties: dict[str, TSLProperty] = field(
+        default_factory=lambda: {}, init=False, repr=False, compare=False
+    )
+    _tsl_services: dict[str, TSLService] = field(
+        default_factory=lambda: {}, init=False, repr=False, compare=False
+    )
+    _gettable_properties: frozenset[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    # Platforms derived from the TSL, filled in by CapabilityDetector
+    required_platforms: frozenset[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index the TSL passed at construction time."""
+        if self.tsl is not None:
+            self.load_tsl(self.tsl)
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AzoulaDevice:
         """Create AzoulaDevice from protocol response dictionary."""
+        (
+            device_id,
+            profile,
+            device_type,
+            product_id,
+            online,
+            protocol,
+            manufacturer,
+        ) = _DEVICE_FIELDS(data)
+        # Values shared by many devices are interned so that they are stored
+        # once instead of once per decoded discovery page entry.
         return cls(
             name=data["config"]["name"],
-            device_id=data["deviceID"],
-            profile=data["profile"],
-            device_type=data["deviceType"],
-            product_id=data["productId"],
-            online=data["online"] == "1",
-            protocol=data["protocol"],
-            manufacturer=data["manufacturer"],
+            device_id=device_id,
+            profile=sys.intern(profile),
+            device_type=sys.intern(device_type),
+            product_id=sys.intern(product_id),
+            online=online == "1",
+            protocol=sys.intern(protocol),
+            manufacturer=sys.intern(manufacturer),
         )
 
     @property
@@ -49,24 +95,50 @@ class AzoulaDevice:
         """Return unique identifier for the device."""
         return self.device_id
 
+    def load_tsl(self, tsl: DeviceTSL | None) -> None:
+        """Attach the device TSL and index its properties and services."""
+        self.tsl = tsl
+        self.required_platforms = None
+        if not tsl:
+            self._tsl_properties = {}
+            self._tsl_services = {}
+            self._gettable_properties = frozenset()
+            return
+
+        self._tsl_properties = {
+            prop["identifier"]: prop
+            for prop in tsl.get("properties", [])
+            if "identifier" in prop
+        }
+        self._tsl_services = {
+            svc["identifier"]: svc
+            for svc in tsl.get("services", [])
+            if "identifier" in svc
+        }
+
+        get_service = self._tsl_services.get(SERVICE_PROPERTY_GET)
+        self._gettable_properties = (
+            frozenset(
+                param["identifier"]
+                for param in get_service.get("inputData", [])
+                if "identifier" in param
+            )
+            if get_service is not None
+            else frozenset()
+        )
+
+    @property
+    def property_identifiers(self) -> KeysView[str]:
+        """Return the identifiers of all properties defined in the TSL."""
+        return self._tsl_properties.keys()
+
     def has_property(self, identifier: str) -> bool:
         """Check if device supports a property based on TSL."""
-        if not self.tsl:
-            return False
-
-        properties: list[TSLProperty] = self.tsl.get("properties", [])
-        return any(prop.get("identifier") == identifier for prop in properties)
+        return identifier in self._tsl_properties
 
     def get_property_spec(self, identifier: str) -> TSLProperty | None:
         """Get property specification from TSL."""
-        if not self.tsl:
-            return None
-
-        properties: list[TSLProperty] = self.tsl.get("properties", [])
-        for prop in properties:
-            if prop.get("identifier") == identifier:
-                return prop
-        return None
+        return self._tsl_properties.get(identifier)
 
     def update_property(self, identifier: str, value: Any) -> None:
         """Update device property value."""
@@ -78,11 +150,7 @@ class AzoulaDevice:
 
     def has_service(self, identifier: str) -> bool:
         """Check if device supports a service based on TSL."""
-        if not self.tsl:
-            return False
-
-        services: list[TSLService] = self.tsl.get("services", [])
-        return any(svc.get("identifier") == identifier for svc in services)
+        return identifier in self._tsl_services
 
     def can_get_property(self, identifier: str) -> bool:
         """Check if property can be retrieved via thing.service.property.get.
@@ -91,24 +159,10 @@ class AzoulaDevice:
         1. The property exists in the TSL
         2. The property is listed in the 'get' service's inputData
         """
-        if not self.tsl:
-            return False
-
-        # First check if property exists
-        if not self.has_property(identifier):
-            return False
-
-        # Check if property is in the get service's inputData
-        services: list[TSLService] = self.tsl.get("services", [])
-        for svc in services:
-            if svc.get("identifier") == "get":
-                input_data = svc.get("inputData", [])
-                return any(
-                    param.get("identifier") == identifier for param in input_data
-                )
-
-        # If no get service found, assume property can't be retrieved
-        return False
+        return (
+            identifier in self._tsl_properties
+            and identifier in self._gettable_properties
+        )
 
     def has_identify_support(self) -> bool:
         """Check if device supports identify service."""
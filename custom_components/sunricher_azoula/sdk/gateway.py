@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+import inspect
+from itertools import chain, count
 import json
 import logging
+import socket
+import threading
 from typing import Any
 import uuid
 
@@ -19,10 +24,31 @@ except ImportError:
     # paho-mqtt < 2.0.0 doesn't have CallbackAPIVersion
     HAS_CALLBACK_API_VERSION = False  # pyright: ignore[reportConstantRedefinition]
 
+try:
+    import orjson
+
+    json_loads: Callable[[bytes | str], Any] = orjson.loads
+    json_dumps: Callable[[Any], bytes] = orjson.dumps
+except ImportError:
+    # orjson is optional; Home Assistant ships it, standalone use falls back
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 encoded JSON."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
 from .const import (
     DEFAULT_DISCOVERY_TIMEOUT,
     DEFAULT_MQTT_PORT,
+    DEFAULT_PROPERTY_GET_BATCH_WINDOW,
+    DEFAULT_PROPERTY_UPDATE_WINDOW,
+    DEFAULT_RECONNECT_MAX_DELAY,
+    DEFAULT_RECONNECT_MIN_DELAY,
     DEFAULT_TSL_TIMEOUT,
+    MAX_CONCURRENT_LISTENER_TASKS,
+    MAX_CONCURRENT_TSL_REQUESTS,
+    MAX_PENDING_MESSAGES,
     METHOD_DEVICE_DISCOVER,
     METHOD_DEVICE_DISCOVER_REPLY,
     METHOD_PROPERTY_GET,
@@ -34,6 +60,8 @@ from .const import (
     METHOD_SERVICE_INVOKE_REPLY,
     METHOD_TSL_GET,
     METHOD_TSL_GET_REPLY,
+    MQTT_MISC_INTERVAL,
+    MQTT_SOCKET_RECEIVE_BUFFER_SIZE,
     SERVICE_DEVICE_IDENTIFY,
     SERVICE_PROPERTY_GET,
     TOPIC_GATEWAY_PREFIX,
@@ -48,9 +76,63 @@ from .types import DeviceTSL, ListenerCallback, PropertyParams
 _LOGGER = logging.getLogger(__name__)
 
 
+# A registered listener and whether it is a coroutine function
+_ListenerEntry = tuple[Callable[..., Any], bool]
+
+
+def _without(
+    listeners: tuple[_ListenerEntry, ...], listener: _ListenerEntry
+) -> tuple[_ListenerEntry, ...]:
+    """Return the listeners with the first occurrence of listener removed."""
+    index = listeners.index(listener)
+    return listeners[:index] + listeners[index + 1 :]
+
+
 class AzoulaGateway:
     """API client for Azoula Smart gateway."""
 
+    __slots__ = (
+        "gateway_id",
+        "_host",
+        "_port",
+        "_username",
+        "_password",
+        "_sub_topic",
+        "_pub_topic",
+        "_request_id_prefix",
+        "_request_counter",
+        "_mqtt_client",
+        "_loop",
+        "_connect_result",
+        "_connection_event",
+        "_last_online",
+        "_loop_thread_id",
+        "_sock",
+        "_sock_fd",
+        "_misc_handle",
+        "_reconnect_task",
+        "_inbox",
+        "_inbox_scheduled",
+        "_method_handlers",
+        "_listeners",
+        "_device_listeners",
+        "_background_tasks",
+        "_discard_background_task",
+        "_listener_semaphore",
+        "_discovered_devices",
+        "_discovered_device_ids",
+        "_devices_received",
+        "_expected_page_count",
+        "_current_page",
+        "_tsl_requests",
+        "_tsl_cache",
+        "_pending_property_gets",
+        "_property_get_handle",
+        "_pending_property_updates",
+        "_property_update_window",
+        "_property_update_handle",
+    )
+
     def __init__(
         self, host: str, username: str, password: str, gateway_id: str
     ) -> None:
@@ -65,7 +147,13 @@ class AzoulaGateway:
         self._pub_topic = f"{TOPIC_GATEWAY_PREFIX}/{self.gateway_id}"
 
         # Generate unique client_id to avoid conflicts
-        client_id = f"ha_azoula_{self.gateway_id}_{uuid.uuid4().hex[:8]}"
+        session_id = uuid.uuid4().hex[:8]
+        client_id = f"ha_azoula_{self.gateway_id}_{session_id}"
+
+        # Request IDs only need to be unique for this client, so a counter
+        # behind the session prefix replaces a random UUID per request.
+        self._request_id_prefix = f"{session_id}-"
+        self._request_counter = count()
 
         if HAS_CALLBACK_API_VERSION:
             # paho-mqtt >= 2.0.0
@@ -83,42 +171,121 @@ class AzoulaGateway:
 
         self._mqtt_client.enable_logger()
 
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._connect_result: int | None = None
         self._connection_event = asyncio.Event()
+        self._last_online: bool | None = None
 
         self._mqtt_client.on_connect = self._on_connect
         self._mqtt_client.on_disconnect = self._on_disconnect
         self._mqtt_client.on_message = self._on_message
 
-        # Multi-listener support
-        self._listeners: dict[CallbackEventType, list[Callable[..., None]]] = {
-            CallbackEventType.ONLINE_STATUS: [],
-            CallbackEventType.PROPERTY_UPDATE: [],
+        # The event loop drives the client through its socket callbacks rather
+        # than a paho network thread.
+        self._mqtt_client.on_socket_open = self._on_socket_open
+        self._mqtt_client.on_socket_close = self._on_socket_close
+        self._mqtt_client.on_socket_register_write = self._on_socket_register_write
+        self._mqtt_client.on_socket_unregister_write = self._on_socket_unregister_write
+        self._loop_thread_id: int | None = None
+        # The socket serviced by the loop and its descriptor, which is kept
+        # because the socket may already be closed when it is unregistered.
+        self._sock: paho_mqtt.SocketLike | None = None
+        self._sock_fd: int | None = None
+        self._misc_handle: asyncio.TimerHandle | None = None
+        self._reconnect_task: asyncio.Task[None] | None = None
+
+        # Messages read from the socket, decoded in one pass once the read is
+        # done. The pass normally runs before the socket is read again, so the
+        # bound only matters if the loop falls behind a message storm, in
+        # which case the oldest messages are dropped.
+        self._inbox: deque[paho_mqtt.MQTTMessage] = deque(maxlen=MAX_PENDING_MESSAGES)
+        self._inbox_scheduled = False
+
+        # Handlers for incoming messages, keyed by protocol method
+        self._method_handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            METHOD_DEVICE_DISCOVER_REPLY: self._handle_device_discover_response,
+            METHOD_PROPERTY_POST: self._handle_property_post,
+            METHOD_PROPERTY_GET_REPLY: self._handle_property_get_reply,
+            METHOD_PROPERTY_SET_REPLY: self._handle_property_set_reply,
+            METHOD_SERVICE_INVOKE_REPLY: self._handle_service_reply,
+            METHOD_TSL_GET_REPLY: self._handle_tsl_reply,
         }
+
+        # Multi-listener support. Listener collections are immutable tuples that
+        # are replaced on (un)registration, so dispatch can iterate them as-is.
+        self._listeners: dict[CallbackEventType, tuple[_ListenerEntry, ...]] = {
+            CallbackEventType.ONLINE_STATUS: (),
+            CallbackEventType.PROPERTY_UPDATE: (),
+        }
+        # Listeners registered for a single device, keyed by event and device ID
+        self._device_listeners: dict[
+            tuple[CallbackEventType, str], tuple[_ListenerEntry, ...]
+        ] = {}
         self._background_tasks: set[asyncio.Task[None]] = set()
+        self._discard_background_task = self._background_tasks.discard
+        # Caps how many coroutine listeners run at once under bursty updates
+        self._listener_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LISTENER_TASKS)
 
         # Device discovery state
         self._discovered_devices: list[AzoulaDevice] = []
+        self._discovered_device_ids: set[str] = set()
         self._devices_received: asyncio.Event | None = None
         self._expected_page_count: int = 0
         self._current_page: int = 0
 
         # TSL (Thing Specification Language) state
-        self._tsl_pending_requests: dict[str, asyncio.Event] = {}
-        self._tsl_responses: dict[str, DeviceTSL | None] = {}
+        self._tsl_requests: dict[str, asyncio.Future[DeviceTSL | None]] = {}
+        # TSLs by (product ID, device type), shared by devices of one product
+        self._tsl_cache: dict[tuple[str, str], DeviceTSL] = {}
+
+        # Property requests waiting to be sent, merged per device
+        self._pending_property_gets: dict[str, dict[str, None]] = {}
+        self._property_get_handle: asyncio.TimerHandle | None = None
+
+        # Property updates waiting to be dispatched, merged per device, and the
+        # devices already notified in the current window
+        self._pending_property_updates: dict[str, dict[str, Any]] = {}
+        self._property_update_window: set[str] = set()
+        self._property_update_handle: asyncio.TimerHandle | None = None
 
     def register_listener(
         self,
         event_type: CallbackEventType,
         listener: ListenerCallback,
+        device_id: str | None = None,
     ) -> Callable[[], None]:
-        """Register a listener for a specific event type."""
+        """Register a listener for a specific event type.
+
+        When ``device_id`` is given, the listener is only called for events
+        reported for that device (or gateway) ID. Property updates are shared
+        by all listeners, so listeners must not modify them.
+        """
         if event_type not in self._listeners:
             return lambda: None
 
-        self._listeners[event_type].append(listener)
+        # Resolved once here so dispatch does not inspect the listener.
+        entry = (listener, inspect.iscoroutinefunction(listener))
+
+        if device_id is None:
+            self._listeners[event_type] += (entry,)
+
+            def remove_listener() -> None:
+                self._listeners[event_type] = _without(
+                    self._listeners[event_type], entry
+                )
+
+            return remove_listener
+
+        key = (event_type, device_id)
+        self._device_listeners[key] = (*self._device_listeners.get(key, ()), entry)
 
-        return lambda: self._listeners[event_type].remove(listener)
+        def remove_device_listener() -> None:
+            if remaining := _without(self._device_listeners[key], entry):
+                self._device_listeners[key] = remaining
+            else:
+                del self._device_listeners[key]
+
+        return remove_device_listener
 
     def _notify_listeners(
         self,
@@ -127,25 +294,100 @@ class AzoulaGateway:
         data: bool | PropertyParams,
     ) -> None:
         """Notify all registered listeners for a specific event type."""
-        for listener in self._listeners.get(event_type, []):
-            if asyncio.iscoroutinefunction(listener):
-                task = asyncio.create_task(listener(dev_id, data))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
+        listeners = self._listeners[event_type]
+        device_listeners = self._device_listeners.get((event_type, dev_id), ())
+        if not listeners and not device_listeners:
+            return
+
+        coroutine_listeners: list[Callable[..., Awaitable[None]]] = []
+        for listener, is_coroutine in chain(listeners, device_listeners):
+            if is_coroutine:
+                coroutine_listeners.append(listener)
             else:
                 listener(dev_id, data)
 
+        if coroutine_listeners:
+            # One task per event runs every coroutine listener, rather than a
+            # task per listener.
+            loop = self._loop or asyncio.get_running_loop()
+            task = loop.create_task(
+                self._run_listeners(coroutine_listeners, dev_id, data)
+            )
+            self._background_tasks.add(task)
+            task.add_done_callback(self._discard_background_task)
+
+    async def _run_listeners(
+        self,
+        listeners: list[Callable[..., Awaitable[None]]],
+        dev_id: str,
+        data: bool | PropertyParams,
+    ) -> None:
+        """Run coroutine listeners together once a concurrency slot is free."""
+        async with self._listener_semaphore:
+            results = await asyncio.gather(
+                *(listener(dev_id, data) for listener in listeners),
+                return_exceptions=True,
+            )
+
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Error in listener for %s on gateway %s",
+                    dev_id,
+                    self.gateway_id,
+                    exc_info=result,
+                )
+
+    def _next_request_id(self) -> str:
+        """Return a new request ID for correlating gateway replies."""
+        return f"{self._request_id_prefix}{next(self._request_counter):x}"
+
+    def _publish(self, payload: dict[str, Any]) -> None:
+        """Publish a request payload to the gateway."""
+        # Every request is answered by a reply message, so broker-level
+        # acknowledgements would only add a round trip.
+        self._mqtt_client.publish(self._pub_topic, json_dumps(payload), qos=0)
+
+    def _call_soon_threadsafe(self, callback: Callable[..., None], *args: Any) -> None:
+        """Schedule a callback on the event loop from any thread."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(callback, *args)
+
+    def _run_on_loop(self, callback: Callable[..., None], *args: Any) -> None:
+        """Run a callback now on the event loop thread, otherwise schedule it."""
+        if threading.get_ident() == self._loop_thread_id:
+            callback(*args)
+        else:
+            self._call_soon_threadsafe(callback, *args)
+
     async def connect(self) -> None:
-        """Connect to the MQTT broker."""
+        """Connect to the MQTT broker.
+
+        A connection that is refused by the broker or not acknowledged in time
+        is torn down with disconnect() before the error is raised, so nothing
+        keeps retrying in the background. Callers retry by calling connect()
+        again; Home Assistant does so when setup raises ConfigEntryNotReady,
+        with a new gateway each time.
+
+        Raises:
+            AzoulaGatewayError: If the broker cannot be reached, rejects the
+                connection or does not acknowledge it in time.
+        """
+        self._loop = loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
         self._connection_event.clear()
         self._connect_result = 0
         self._mqtt_client.username_pw_set(self._username, self._password)
 
         try:
-            self._mqtt_client.connect(self._host, self._port)
-            self._mqtt_client.loop_start()
+            # Resolving the host and opening the socket block, so run them in
+            # the executor. The socket is then serviced by the event loop.
+            await loop.run_in_executor(
+                None, self._mqtt_client.connect, self._host, self._port
+            )
             await asyncio.wait_for(self._connection_event.wait(), timeout=10)
         except TimeoutError as err:
+            await self.disconnect()
             raise AzoulaGatewayError("Connection timeout", self.gateway_id) from err
         except (ConnectionRefusedError, OSError) as err:
             raise AzoulaGatewayError(f"Network error: {err}", self.gateway_id) from err
@@ -159,6 +401,8 @@ class AzoulaGateway:
             )
             return
 
+        await self.disconnect()
+
         if self._connect_result in (4, 5):
             raise AzoulaGatewayError(
                 "Authentication failed. Please press the gateway button and retry",
@@ -172,10 +416,108 @@ class AzoulaGateway:
 
     async def disconnect(self) -> None:
         """Disconnect from the MQTT broker."""
-        self._mqtt_client.loop_stop()
+        if self._property_get_handle is not None:
+            self._property_get_handle.cancel()
+            self._property_get_handle = None
+        self._pending_property_gets.clear()
+        if self._property_update_handle is not None:
+            self._property_update_handle.cancel()
+            self._property_update_handle = None
+        self._pending_property_updates.clear()
+        self._property_update_window.clear()
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
         self._mqtt_client.disconnect()
+        # Flush the DISCONNECT packet right away; paho closes the socket once
+        # it has been written.
+        self._mqtt_client.loop_write()
         self._connection_event.clear()
 
+    def _on_socket_open(
+        self, client: paho_mqtt.Client, userdata: Any, sock: paho_mqtt.SocketLike
+    ) -> None:
+        # Sockets are opened by connect() and reconnect() in the executor.
+        self._run_on_loop(self._handle_socket_open, sock)
+
+    def _handle_socket_open(self, sock: paho_mqtt.SocketLike) -> None:
+        """Start reading the MQTT socket and servicing keepalives."""
+        if (loop := self._loop) is None or (fd := sock.fileno()) == -1:
+            return
+
+        self._sock = sock
+        self._sock_fd = fd
+        self._increase_socket_buffer(sock)
+        loop.add_reader(fd, self._mqtt_client.loop_read)
+        if self._misc_handle is None:
+            self._misc_handle = loop.call_later(MQTT_MISC_INTERVAL, self._run_misc)
+
+    def _on_socket_close(
+        self, client: paho_mqtt.Client, userdata: Any, sock: paho_mqtt.SocketLike
+    ) -> None:
+        self._run_on_loop(self._handle_socket_close, sock)
+
+    def _handle_socket_close(self, sock: paho_mqtt.SocketLike) -> None:
+        """Stop servicing the MQTT socket.
+
+        When the socket was closed from the executor it is already closed by
+        the time this runs, so it is unregistered by the descriptor recorded
+        when it was opened. Leaving a stale descriptor in the selector would
+        stop reads on a new socket that reuses its number.
+        """
+        if sock is not self._sock:
+            return
+
+        if self._misc_handle is not None:
+            self._misc_handle.cancel()
+            self._misc_handle = None
+
+        fd = self._sock_fd
+        self._sock = None
+        self._sock_fd = None
+        if (loop := self._loop) is not None and fd is not None:
+            loop.remove_reader(fd)
+            loop.remove_writer(fd)
+
+    def _on_socket_register_write(
+        self, client: paho_mqtt.Client, userdata: Any, sock: paho_mqtt.SocketLike
+    ) -> None:
+        self._run_on_loop(self._handle_socket_register_write, sock)
+
+    def _handle_socket_register_write(self, sock: paho_mqtt.SocketLike) -> None:
+        """Write queued packets once the socket is writable."""
+        if (
+            sock is self._sock
+            and (loop := self._loop) is not None
+            and (fd := self._sock_fd) is not None
+        ):
+            loop.add_writer(fd, self._mqtt_client.loop_write)
+
+    def _on_socket_unregister_write(
+        self, client: paho_mqtt.Client, userdata: Any, sock: paho_mqtt.SocketLike
+    ) -> None:
+        self._run_on_loop(self._handle_socket_unregister_write, sock)
+
+    def _handle_socket_unregister_write(self, sock: paho_mqtt.SocketLike) -> None:
+        """Stop watching the socket once all queued packets are written."""
+        if (
+            sock is self._sock
+            and (loop := self._loop) is not None
+            and (fd := self._sock_fd) is not None
+        ):
+            loop.remove_writer(fd)
+
+    def _run_misc(self) -> None:
+        """Send keepalive pings and detect a dead connection."""
+        self._misc_handle = None
+        if self._mqtt_client.loop_misc() != paho_mqtt.MQTT_ERR_SUCCESS:
+            return
+
+        if self._loop is not None:
+            self._misc_handle = self._loop.call_later(
+                MQTT_MISC_INTERVAL, self._run_misc
+            )
+
     def _on_connect(
         self,
         client: paho_mqtt.Client,
@@ -184,9 +526,6 @@ class AzoulaGateway:
         rc: int,
         properties: Any = None,
     ) -> None:
-        self._connect_result = rc
-        self._connection_event.set()
-
         if rc == 0:
             self._mqtt_client.subscribe(self._sub_topic)
             _LOGGER.debug(
@@ -195,10 +534,40 @@ class AzoulaGateway:
                 self.gateway_id,
             )
 
-            self._notify_listeners(
-                CallbackEventType.ONLINE_STATUS, self.gateway_id, True
+        self._call_soon_threadsafe(self._handle_connect, rc)
+
+    def _increase_socket_buffer(self, sock: paho_mqtt.SocketLike) -> None:
+        """Enlarge the receive buffer so reply bursts are not dropped."""
+        if not isinstance(sock, socket.socket):
+            return
+
+        try:
+            sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, MQTT_SOCKET_RECEIVE_BUFFER_SIZE
+            )
+        except OSError as err:
+            _LOGGER.warning(
+                "Unable to increase the socket buffer size for gateway %s: %s",
+                self.gateway_id,
+                err,
             )
 
+    def _handle_connect(self, rc: int) -> None:
+        """Handle the connection result on the event loop."""
+        self._connect_result = rc
+        self._connection_event.set()
+
+        if rc == 0:
+            self._set_online(True)
+
+    def _set_online(self, online: bool) -> None:
+        """Notify listeners when the gateway connection state changes."""
+        if online == self._last_online:
+            return
+
+        self._last_online = online
+        self._notify_listeners(CallbackEventType.ONLINE_STATUS, self.gateway_id, online)
+
     def _on_disconnect(
         self,
         client: paho_mqtt.Client,
@@ -224,14 +593,79 @@ class AzoulaGateway:
         else:
             _LOGGER.debug("MQTT disconnected for gateway %s", self.gateway_id)
 
-        self._notify_listeners(CallbackEventType.ONLINE_STATUS, self.gateway_id, False)
+        self._call_soon_threadsafe(self._handle_disconnect, reason_code != 0)
+
+    def _handle_disconnect(self, unexpected: bool) -> None:
+        """Mark the gateway offline and reconnect after an unexpected drop."""
+        self._set_online(False)
+
+        if (
+            unexpected
+            and self._reconnect_task is None
+            and (loop := self._loop) is not None
+        ):
+            self._reconnect_task = loop.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """Retry the broker connection until the socket is open again.
+
+        The delay between attempts doubles up to a limit, matching the
+        backoff paho's own network loop used before the event loop drove it.
+        """
+        loop = asyncio.get_running_loop()
+        delay = DEFAULT_RECONNECT_MIN_DELAY
+        try:
+            while True:
+                await asyncio.sleep(delay)
+                try:
+                    await loop.run_in_executor(None, self._mqtt_client.reconnect)
+                except Exception as err:
+                    # Any failure, not just socket errors, must keep the retry
+                    # loop alive or the gateway would stay offline for good.
+                    delay = min(delay * 2, DEFAULT_RECONNECT_MAX_DELAY)
+                    _LOGGER.warning(
+                        "Reconnecting to gateway %s failed, retrying in %ss: %s",
+                        self.gateway_id,
+                        delay,
+                        err,
+                    )
+                else:
+                    return
+        finally:
+            self._reconnect_task = None
 
     def _on_message(
         self, client: paho_mqtt.Client, userdata: Any, msg: paho_mqtt.MQTTMessage
     ) -> None:
+        # Decoding and dispatch are deferred until the current loop_read() call
+        # returns. paho may handle several packets per call, sized from its
+        # in-flight queues, so a burst is decoded in a single pass. Socket
+        # reads run on the event loop, so no thread-safe wakeup is needed.
+        if len(self._inbox) == MAX_PENDING_MESSAGES:
+            _LOGGER.debug(
+                "Message backlog full for gateway %s, dropping oldest message",
+                self.gateway_id,
+            )
+        self._inbox.append(msg)
+        if not self._inbox_scheduled and (loop := self._loop) is not None:
+            self._inbox_scheduled = True
+            loop.call_soon(self._process_inbox)
+
+    def _process_inbox(self) -> None:
+        """Handle all messages queued by the socket reader."""
+        # Clear the flag before draining so a message queued meanwhile either
+        # gets drained here or schedules another pass.
+        self._inbox_scheduled = False
+        inbox = self._inbox
+        while inbox:
+            self._handle_message(inbox.popleft())
+
+    def _handle_message(self, msg: paho_mqtt.MQTTMessage) -> None:
+        """Decode an incoming MQTT message and dispatch it by method."""
         try:
-            payload_json = json.loads(msg.payload.decode("utf-8", errors="replace"))
-        except json.JSONDecodeError:
+            payload_json = json_loads(msg.payload)
+        except ValueError:
+            # Covers both malformed JSON and payloads that are not valid UTF-8.
             _LOGGER.warning(
                 "Invalid JSON in MQTT message from gateway %s: %s",
                 self.gateway_id,
@@ -239,12 +673,15 @@ class AzoulaGateway:
             )
             return
 
-        _LOGGER.debug(
-            "Received MQTT message from gateway %s on topic %s: %s",
-            self.gateway_id,
-            msg.topic,
-            payload_json,
-        )
+        # Checked up front so the per-message path skips the call (and the
+        # topic decode) entirely when debug logging is off.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Received MQTT message from gateway %s on topic %s: %s",
+                self.gateway_id,
+                msg.topic,
+                payload_json,
+            )
 
         method = payload_json.get("method")
         if not method:
@@ -254,16 +691,7 @@ class AzoulaGateway:
             )
             return
 
-        method_handlers: dict[str, Callable[[dict[str, Any]], None]] = {
-            METHOD_DEVICE_DISCOVER_REPLY: self._handle_device_discover_response,
-            METHOD_PROPERTY_POST: self._handle_property_post,
-            METHOD_PROPERTY_GET_REPLY: self._handle_property_get_reply,
-            METHOD_PROPERTY_SET_REPLY: self._handle_property_set_reply,
-            METHOD_SERVICE_INVOKE_REPLY: self._handle_service_reply,
-            METHOD_TSL_GET_REPLY: self._handle_tsl_reply,
-        }
-
-        handler = method_handlers.get(method)
+        handler = self._method_handlers.get(method)
         if handler:
             handler(payload_json)
         else:
@@ -278,19 +706,17 @@ class AzoulaGateway:
         """Discover all sub-devices under the gateway."""
         self._devices_received = asyncio.Event()
         self._discovered_devices = []
+        self._discovered_device_ids = set()
         self._expected_page_count = 0
         self._current_page = 0
 
         request_payload = {
-            "id": str(uuid.uuid4()),
+            "id": self._next_request_id(),
             "deviceID": self.gateway_id,
             "method": METHOD_DEVICE_DISCOVER,
         }
 
-        self._mqtt_client.publish(
-            self._pub_topic,
-            json.dumps(request_payload),
-        )
+        self._publish(request_payload)
 
         try:
             await asyncio.wait_for(
@@ -304,16 +730,48 @@ class AzoulaGateway:
             )
 
         if load_tsl:
+            # Devices of the same product share a TSL, so it is requested once
+            # per product and reused from the cache on later discoveries.
+            devices_by_product: dict[tuple[str, str], list[AzoulaDevice]] = {}
             for device in self._discovered_devices:
-                _LOGGER.debug(
-                    "Loading TSL for device %s (%s)",
-                    device.device_id,
-                    device.name,
+                key = (device.product_id, device.device_type)
+                if (tsl := self._tsl_cache.get(key)) is not None:
+                    device.load_tsl(tsl)
+                else:
+                    devices_by_product.setdefault(key, []).append(device)
+
+            # TSL requests are independent, so overlap their round trips while
+            # keeping the number in flight small enough for the gateway.
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_TSL_REQUESTS)
+
+            async def _load_product_tsl(
+                key: tuple[str, str], devices: list[AzoulaDevice]
+            ) -> None:
+                device = devices[0]
+                async with semaphore:
+                    _LOGGER.debug(
+                        "Loading TSL for device %s (%s)",
+                        device.device_id,
+                        device.name,
+                    )
+                    tsl = await self.get_device_tsl(device.device_id)
+
+                if tsl is not None:
+                    self._tsl_cache[key] = tsl
+                for device in devices:
+                    device.load_tsl(tsl)
+
+            await asyncio.gather(
+                *(
+                    _load_product_tsl(key, devices)
+                    for key, devices in devices_by_product.items()
                 )
-                tsl = await self.get_device_tsl(device.device_id)
-                device.tsl = tsl
+            )
 
-        return self._discovered_devices.copy()
+        # Hand the list to the caller instead of copying it. Pages arriving
+        # after a timeout go to a fresh list the caller never sees.
+        devices, self._discovered_devices = self._discovered_devices, []
+        return devices
 
     async def invoke_service(
         self,
@@ -323,25 +781,23 @@ class AzoulaGateway:
     ) -> None:
         """Invoke a device service (thing.service)."""
         request_payload: dict[str, Any] = {
-            "id": str(uuid.uuid4()),
+            "id": self._next_request_id(),
             "deviceID": device_id,
             "method": METHOD_SERVICE_INVOKE,
             "identifier": service_identifier,
             "params": params if params is not None else {},
         }
 
-        self._mqtt_client.publish(
-            self._pub_topic,
-            json.dumps(request_payload),
-        )
+        self._publish(request_payload)
 
-        _LOGGER.debug(
-            "Invoked service %s for device %s with params %s on gateway %s",
-            service_identifier,
-            device_id,
-            params,
-            self.gateway_id,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Invoked service %s for device %s with params %s on gateway %s",
+                service_identifier,
+                device_id,
+                params,
+                self.gateway_id,
+            )
 
     async def identify_device(self, device_id: str) -> None:
         """Trigger device identification (flashing/beeping).
@@ -360,28 +816,46 @@ class AzoulaGateway:
     async def get_device_properties(
         self,
         device_id: str,
-        properties: list[str],
+        properties: Sequence[str],
     ) -> None:
-        """Request device properties via thing.service.property.get."""
-        request_payload: dict[str, Any] = {
-            "id": str(uuid.uuid4()),
-            "deviceID": device_id,
-            "method": METHOD_PROPERTY_GET,
-            "identifier": SERVICE_PROPERTY_GET,
-            "params": properties,
-        }
+        """Request device properties via thing.service.property.get.
 
-        self._mqtt_client.publish(
-            self._pub_topic,
-            json.dumps(request_payload),
+        Requests made within a short window are merged, so each device is
+        queried once with the union of the requested properties.
+        """
+        self._pending_property_gets.setdefault(device_id, {}).update(
+            dict.fromkeys(properties)
         )
 
-        _LOGGER.debug(
-            "Requested properties %s for device %s on gateway %s",
-            properties,
-            device_id,
-            self.gateway_id,
-        )
+        if self._property_get_handle is None:
+            loop = self._loop or asyncio.get_running_loop()
+            self._property_get_handle = loop.call_later(
+                DEFAULT_PROPERTY_GET_BATCH_WINDOW, self._flush_property_gets
+            )
+
+    def _flush_property_gets(self) -> None:
+        """Publish the property requests collected during the batch window."""
+        self._property_get_handle = None
+        pending, self._pending_property_gets = self._pending_property_gets, {}
+
+        for device_id, properties in pending.items():
+            request_payload: dict[str, Any] = {
+                "id": self._next_request_id(),
+                "deviceID": device_id,
+                "method": METHOD_PROPERTY_GET,
+                "identifier": SERVICE_PROPERTY_GET,
+                "params": list(properties),
+            }
+
+            self._publish(request_payload)
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Requested properties %s for device %s on gateway %s",
+                    request_payload["params"],
+                    device_id,
+                    self.gateway_id,
+                )
 
     async def set_device_properties(
         self,
@@ -390,16 +864,13 @@ class AzoulaGateway:
     ) -> None:
         """Set device properties via thing.service.property.set."""
         request_payload: dict[str, Any] = {
-            "id": str(uuid.uuid4()),
+            "id": self._next_request_id(),
             "deviceID": device_id,
             "method": METHOD_PROPERTY_SET,
             "params": properties,
         }
 
-        self._mqtt_client.publish(
-            self._pub_topic,
-            json.dumps(request_payload),
-        )
+        self._publish(request_payload)
 
         _LOGGER.debug(
             "Setting properties %s for device %s on gateway %s",
@@ -415,7 +886,7 @@ class AzoulaGateway:
         timeout_seconds: float = DEFAULT_TSL_TIMEOUT,
     ) -> DeviceTSL | None:
         """Get device Thing Specification Language (物模型)."""
-        request_id = str(uuid.uuid4())
+        request_id = self._next_request_id()
         request_payload: dict[str, Any] = {
             "id": request_id,
             "version": "1.0",
@@ -424,15 +895,13 @@ class AzoulaGateway:
             "method": METHOD_TSL_GET,
         }
 
-        event = asyncio.Event()
-        self._tsl_pending_requests[request_id] = event
-        self._tsl_responses[request_id] = None
+        future: asyncio.Future[DeviceTSL | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._tsl_requests[request_id] = future
 
         try:
-            self._mqtt_client.publish(
-                self._pub_topic,
-                json.dumps(request_payload),
-            )
+            self._publish(request_payload)
 
             _LOGGER.debug(
                 "Requested TSL for device %s (language: %s) on gateway %s",
@@ -441,8 +910,7 @@ class AzoulaGateway:
                 self.gateway_id,
             )
 
-            await asyncio.wait_for(event.wait(), timeout=timeout_seconds)
-            return self._tsl_responses.get(request_id)
+            return await asyncio.wait_for(future, timeout=timeout_seconds)
 
         except TimeoutError:
             _LOGGER.warning(
@@ -452,8 +920,7 @@ class AzoulaGateway:
             )
             return None
         finally:
-            self._tsl_pending_requests.pop(request_id, None)
-            self._tsl_responses.pop(request_id, None)
+            self._tsl_requests.pop(request_id, None)
 
     def _handle_device_discover_response(self, payload: dict[str, Any]) -> None:
         """Handle device discovery response with pagination support."""
@@ -468,15 +935,21 @@ class AzoulaGateway:
         if self._expected_page_count == 0:
             self._expected_page_count = page_count
 
-        data = payload.get("data", {})
-        device_list = data.get("deviceList", [])
+        # Index directly: the list is nearly always present, and .get would
+        # allocate an empty default container on every call.
+        try:
+            device_list = payload["data"]["deviceList"]
+        except KeyError:
+            device_list = ()
 
+        # Duplicates are skipped on the raw ID before a device is built.
+        seen_ids = self._discovered_device_ids
         for device_data in device_list:
-            device = AzoulaDevice.from_dict(device_data)
-            if not any(
-                d.unique_id == device.unique_id for d in self._discovered_devices
-            ):
-                self._discovered_devices.append(device)
+            device_id = device_data["deviceID"]
+            if device_id in seen_ids:
+                continue
+            seen_ids.add(device_id)
+            self._discovered_devices.append(AzoulaDevice.from_dict(device_data))
 
         self._current_page = current_page
 
@@ -487,29 +960,83 @@ class AzoulaGateway:
     def _handle_property_post(self, payload: dict[str, Any]) -> None:
         """Handle property post message (thing.event.property.post)."""
         device_id = payload.get("deviceID")
-        params = payload.get("params", {})
+        if not device_id or not self._has_property_listeners(device_id):
+            return
 
-        if not device_id:
+        try:
+            params = payload["params"]
+        except KeyError:
             return
 
-        _LOGGER.debug(
-            "Property update for device %s on gateway %s: %s",
-            device_id,
-            self.gateway_id,
-            params,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Property update for device %s on gateway %s: %s",
+                device_id,
+                self.gateway_id,
+                params,
+            )
 
-        self._notify_listeners(
-            CallbackEventType.PROPERTY_UPDATE,
-            device_id,
-            params,
+        self._queue_property_update(device_id, params)
+
+    def _has_property_listeners(self, device_id: str) -> bool:
+        """Return whether any listener would receive updates for the device."""
+        return bool(self._listeners[CallbackEventType.PROPERTY_UPDATE]) or (
+            (CallbackEventType.PROPERTY_UPDATE, device_id) in self._device_listeners
         )
 
+    def _queue_property_update(self, device_id: str, params: PropertyParams) -> None:
+        """Dispatch a property update, merging bursts per device.
+
+        Devices post bursts of updates while dimming or changing color. The
+        first update of a device is dispatched right away and opens a window;
+        updates arriving within it are merged and dispatched once when it
+        closes, with the latest value of every property in the order it was
+        last reported.
+        """
+        if device_id not in self._property_update_window:
+            self._property_update_window.add(device_id)
+            self._start_property_update_window()
+            self._notify_listeners(CallbackEventType.PROPERTY_UPDATE, device_id, params)
+            return
+
+        if (pending := self._pending_property_updates.get(device_id)) is None:
+            pending = self._pending_property_updates[device_id] = {}
+        for key, value in params.items():
+            # Re-inserted so the key moves to the end, as dict.update would
+            # keep it where it first appeared.
+            pending.pop(key, None)
+            pending[key] = value
+
+    def _start_property_update_window(self) -> None:
+        """Schedule the end of the property update window."""
+        if self._property_update_handle is None:
+            loop = self._loop or asyncio.get_running_loop()
+            self._property_update_handle = loop.call_later(
+                DEFAULT_PROPERTY_UPDATE_WINDOW, self._flush_property_updates
+            )
+
+    def _flush_property_updates(self) -> None:
+        """Notify listeners of the property updates merged during the window."""
+        self._property_update_handle = None
+        pending, self._pending_property_updates = self._pending_property_updates, {}
+
+        # Devices notified now open the next window, so a sustained burst is
+        # still dispatched at most once per window.
+        self._property_update_window = set(pending)
+        if pending:
+            self._start_property_update_window()
+
+        for device_id, params in pending.items():
+            self._notify_listeners(
+                CallbackEventType.PROPERTY_UPDATE,
+                device_id,
+                params,  # type: ignore[arg-type]
+            )
+
     def _handle_property_get_reply(self, payload: dict[str, Any]) -> None:
         """Handle property get reply (thing.service.property.get.reply)."""
         code = payload.get("code", 0)
         device_id = payload.get("deviceID")
-        data = payload.get("data", {})
 
         if code != 200:
             _LOGGER.warning(
@@ -520,19 +1047,33 @@ class AzoulaGateway:
             )
             return
 
-        if not device_id or not data:
+        if not device_id or not self._has_property_listeners(device_id):
             return
 
-        _LOGGER.debug(
-            "Property get reply for device %s on gateway %s: %s",
-            device_id,
-            self.gateway_id,
-            data,
-        )
+        data = payload.get("data")
+        if not data:
+            return
 
-        normalized_data = {}
-        for prop_name, prop_value in data.items():
-            normalized_data[prop_name] = {"value": prop_value}
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Property get reply for device %s on gateway %s: %s",
+                device_id,
+                self.gateway_id,
+                data,
+            )
+
+        normalized_data = {
+            prop_name: {"value": prop_value} for prop_name, prop_value in data.items()
+        }
+
+        # A reply reports the current state, so it is dispatched right away
+        # rather than merged with posts, and supersedes merged posts for the
+        # same properties.
+        if (pending := self._pending_property_updates.get(device_id)) is not None:
+            for prop_name in normalized_data:
+                pending.pop(prop_name, None)
+            if not pending:
+                del self._pending_property_updates[device_id]
 
         self._notify_listeners(
             CallbackEventType.PROPERTY_UPDATE,
@@ -581,7 +1122,8 @@ class AzoulaGateway:
         request_id = payload.get("id")
         message = payload.get("message", "")
 
-        if not request_id or request_id not in self._tsl_pending_requests:
+        future = self._tsl_requests.pop(request_id, None) if request_id else None
+        if future is None or future.done():
             _LOGGER.debug(
                 "Received TSL reply for unknown request %s on gateway %s",
                 request_id,
@@ -597,8 +1139,7 @@ class AzoulaGateway:
                 message,
                 request_id,
             )
-            self._tsl_responses[request_id] = None
-            self._tsl_pending_requests[request_id].set()
+            future.set_result(None)
             return
 
         tsl_data = payload.get("tsl")
@@ -609,12 +1150,10 @@ class AzoulaGateway:
                 tsl_data.get("profile"),
                 tsl_data.get("deviceType"),
             )
-            self._tsl_responses[request_id] = tsl_data
+            future.set_result(tsl_data)
         else:
             _LOGGER.warning(
                 "TSL reply missing 'tsl' field on gateway %s",
                 self.gateway_id,
             )
-            self._tsl_responses[request_id] = None
-
-        self._tsl_pending_requests[request_id].set()
+            future.set_result(None)
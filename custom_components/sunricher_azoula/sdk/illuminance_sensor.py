@@ -5,8 +5,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+# (profile, deviceType) of an illuminance sensor
+_ILLUMINANCE_SENSOR_KEY = ("0104", "0106")
 
-@dataclass
+
+@dataclass(slots=True)
 class IlluminanceSensor:
     """Represents an illuminance sensor device under the Azoula gateway.
 
@@ -49,6 +52,4 @@ class IlluminanceSensor:
     @staticmethod
     def is_illuminance_sensor_device(data: dict[str, Any]) -> bool:
         """Check if device data represents an illuminance sensor device."""
-        profile = data.get("profile", "")
-        device_type = data.get("deviceType", "")
-        return bool(profile == "0104" and device_type == "0106")
+        return (data.get("profile"), data.get("deviceType")) == _ILLUMINANCE_SENSOR_KEY
@@ -5,8 +5,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+# Device types in the lighting range (01xx) that are sensors, not lights
+_NON_LIGHT_DEVICE_TYPES = frozenset({"0106", "0107"})
 
-@dataclass
+
+@dataclass(slots=True)
 class Light:
     """Represents a light device under the Azoula gateway."""
 
@@ -54,11 +57,9 @@ class Light:
         - 0108-010d: Light ballasts and units
         - 01Ex: DALI lights
         """
-        profile = data.get("profile", "")
-        device_type = data.get("deviceType", "")
+        if data.get("profile") != "0104":
+            return False
+
         # Lighting devices start with 01, but exclude sensors
-        return bool(
-            profile == "0104"
-            and device_type.startswith("01")
-            and device_type not in ("0106", "0107")
-        )
+        device_type = data.get("deviceType", "")
+        return device_type[:2] == "01" and device_type not in _NON_LIGHT_DEVICE_TYPES
@@ -5,8 +5,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+# (profile, deviceType) of an occupancy sensor
+_OCCUPANCY_SENSOR_KEY = ("0104", "0107")
 
-@dataclass
+
+@dataclass(slots=True)
 class OccupancySensor:
     """Represents an occupancy sensor device under the Azoula gateway.
 
@@ -49,6 +52,4 @@ class OccupancySensor:
     @staticmethod
     def is_occupancy_sensor_device(data: dict[str, Any]) -> bool:
         """Check if device data represents an occupancy sensor device."""
-        profile = data.get("profile", "")
-        device_type = data.get("deviceType", "")
-        return bool(profile == "0104" and device_type == "0107")
+        return (data.get("profile"), data.get("deviceType")) == _OCCUPANCY_SENSOR_KEY
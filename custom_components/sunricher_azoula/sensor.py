@@ -11,10 +11,10 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import LIGHT_LUX, EntityCategory, UnitOfEnergy, UnitOfPower
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
-from .sdk.const import CallbackEventType
+from .entity import AzoulaEntity
 from .sdk.device import AzoulaDevice
 from .sdk.gateway import AzoulaGateway
 from .sdk.types import PropertyParams
@@ -33,221 +33,99 @@ async def async_setup_entry(
 
     for device in entry.runtime_data.devices:
         gateway = entry.runtime_data.gateway
+        device_info = entry.runtime_data.device_info[device.device_id]
 
         # Illuminance sensor
         if device.has_property("IllumMeasuredValue"):
-            entities.append(AzoulaIlluminanceSensor(device, gateway))
+            entities.append(AzoulaIlluminanceSensor(device, gateway, device_info))
 
         # Energy monitoring sensors
         if device.has_property("CurrentSummationDelivered"):
-            entities.append(AzoulaEnergySensor(device, gateway))
+            entities.append(AzoulaEnergySensor(device, gateway, device_info))
 
         if device.has_property("ActivePower_User"):
-            entities.append(AzoulaPowerSensor(device, gateway))
+            entities.append(AzoulaPowerSensor(device, gateway, device_info))
 
     async_add_entities(entities)
 
 
-class AzoulaIlluminanceSensor(SensorEntity):
+class AzoulaIlluminanceSensor(AzoulaEntity, SensorEntity):
     """Representation of an Azoula Smart illuminance sensor."""
 
-    _attr_has_entity_name = True
+    _attr_name = "Illuminance"
     _attr_device_class = SensorDeviceClass.ILLUMINANCE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = LIGHT_LUX
+    _required_properties = ("IllumMeasuredValue",)
 
-    def __init__(self, device: AzoulaDevice, gateway: AzoulaGateway) -> None:
+    def __init__(
+        self, device: AzoulaDevice, gateway: AzoulaGateway, device_info: DeviceInfo
+    ) -> None:
         """Initialize the sensor entity."""
-        self._device = device
-        self._gateway = gateway
-        self._attr_name = "Illuminance"
+        super().__init__(device, gateway, device_info)
         self._attr_unique_id = f"{device.device_id}-illuminance"
-        self._attr_available = device.online
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device.device_id)},
-            "name": device.name,
-            "manufacturer": device.manufacturer,
-            "model": device.product_id,
-            "via_device": (DOMAIN, gateway.gateway_id),
-        }
-
-    async def async_added_to_hass(self) -> None:
-        """Handle entity addition to Home Assistant."""
-
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.PROPERTY_UPDATE, self._handle_device_update
-            )
-        )
-
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.ONLINE_STATUS, self._handle_availability
-            )
-        )
-
-        await self._gateway.get_device_properties(
-            self._device.device_id,
-            ["IllumMeasuredValue"],
-        )
-
-        _LOGGER.debug(
-            "Requested initial properties for illuminance sensor %s",
-            self._device.device_id,
-        )
 
     @callback
     def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
-        if dev_id != self._device.device_id:
+        prop = status.get("IllumMeasuredValue")
+        if prop is None:
             return
 
-        if "IllumMeasuredValue" in status:
-            self._attr_native_value = status["IllumMeasuredValue"]["value"]
+        self._attr_native_value = prop["value"]
+        self.async_write_ha_state()
 
-        self.schedule_update_ha_state()
 
-    @callback
-    def _handle_availability(self, dev_id: str, available: bool) -> None:
-        if dev_id not in (self._device.device_id, self._gateway.gateway_id):
-            return
-
-        self._attr_available = available
-        self.schedule_update_ha_state()
-
-
-class AzoulaEnergySensor(SensorEntity):
+class AzoulaEnergySensor(AzoulaEntity, SensorEntity):
     """Representation of an Azoula Smart energy consumption sensor."""
 
-    _attr_has_entity_name = True
+    _attr_name = "Energy"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _required_properties = ("CurrentSummationDelivered",)
 
-    def __init__(self, device: AzoulaDevice, gateway: AzoulaGateway) -> None:
+    def __init__(
+        self, device: AzoulaDevice, gateway: AzoulaGateway, device_info: DeviceInfo
+    ) -> None:
         """Initialize the energy sensor entity."""
-        self._device = device
-        self._gateway = gateway
-        self._attr_name = "Energy"
+        super().__init__(device, gateway, device_info)
         self._attr_unique_id = f"{device.device_id}-energy"
-        self._attr_available = device.online
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device.device_id)},
-            "name": device.name,
-            "manufacturer": device.manufacturer,
-            "model": device.product_id,
-            "via_device": (DOMAIN, gateway.gateway_id),
-        }
-
-    async def async_added_to_hass(self) -> None:
-        """Handle entity addition to Home Assistant."""
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.PROPERTY_UPDATE, self._handle_device_update
-            )
-        )
-
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.ONLINE_STATUS, self._handle_availability
-            )
-        )
-
-        await self._gateway.get_device_properties(
-            self._device.device_id,
-            ["CurrentSummationDelivered"],
-        )
-
-        _LOGGER.debug(
-            "Requested initial properties for energy sensor %s",
-            self._device.device_id,
-        )
 
     @callback
     def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
         """Handle device property update."""
-        if dev_id != self._device.device_id:
+        prop = status.get("CurrentSummationDelivered")
+        if prop is None:
             return
 
-        if "CurrentSummationDelivered" in status:
-            self._attr_native_value = status["CurrentSummationDelivered"]["value"]
-
-        self.schedule_update_ha_state()
+        self._attr_native_value = prop["value"]
+        self.async_write_ha_state()
 
-    @callback
-    def _handle_availability(self, dev_id: str, available: bool) -> None:
-        """Handle device availability update."""
-        if dev_id not in (self._device.device_id, self._gateway.gateway_id):
-            return
 
-        self._attr_available = available
-        self.schedule_update_ha_state()
-
-
-class AzoulaPowerSensor(SensorEntity):
+class AzoulaPowerSensor(AzoulaEntity, SensorEntity):
     """Representation of an Azoula Smart power consumption sensor."""
 
-    _attr_has_entity_name = True
+    _attr_name = "Power"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_device_class = SensorDeviceClass.POWER
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfPower.WATT
+    _required_properties = ("ActivePower_User",)
 
-    def __init__(self, device: AzoulaDevice, gateway: AzoulaGateway) -> None:
+    def __init__(
+        self, device: AzoulaDevice, gateway: AzoulaGateway, device_info: DeviceInfo
+    ) -> None:
         """Initialize the power sensor entity."""
-        self._device = device
-        self._gateway = gateway
-        self._attr_name = "Power"
+        super().__init__(device, gateway, device_info)
         self._attr_unique_id = f"{device.device_id}-power"
-        self._attr_available = device.online
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device.device_id)},
-            "name": device.name,
-            "manufacturer": device.manufacturer,
-            "model": device.product_id,
-            "via_device": (DOMAIN, gateway.gateway_id),
-        }
-
-    async def async_added_to_hass(self) -> None:
-        """Handle entity addition to Home Assistant."""
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.PROPERTY_UPDATE, self._handle_device_update
-            )
-        )
-
-        self.async_on_remove(
-            self._gateway.register_listener(
-                CallbackEventType.ONLINE_STATUS, self._handle_availability
-            )
-        )
-
-        await self._gateway.get_device_properties(
-            self._device.device_id,
-            ["ActivePower_User"],
-        )
-
-        _LOGGER.debug(
-            "Requested initial properties for power sensor %s",
-            self._device.device_id,
-        )
 
     @callback
     def _handle_device_update(self, dev_id: str, status: PropertyParams) -> None:
         """Handle device property update."""
-        if dev_id != self._device.device_id:
-            return
-
-        if "ActivePower_User" in status:
-            self._attr_native_value = status["ActivePower_User"]["value"]
-
-        self.schedule_update_ha_state()
-
-    @callback
-    def _handle_availability(self, dev_id: str, available: bool) -> None:
-        """Handle device availability update."""
-        if dev_id not in (self._device.device_id, self._gateway.gateway_id):
+        prop = status.get("ActivePower_User")
+        if prop is None:
             return
 
-        self._attr_available = available
-        self.schedule_update_ha_state()
+        self._attr_native_value = prop["value"]
+        self.async_write_ha_state()
@@ -5,17 +5,21 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .sdk.device import AzoulaDevice
 from .sdk.gateway import AzoulaGateway
 
 
-@dataclass
+@dataclass(slots=True)
 class AzoulaSmartData:
     """Runtime data for the Azoula Smart Hub integration."""
 
     gateway: AzoulaGateway
     devices: list[AzoulaDevice]
+    device_info: dict[str, DeviceInfo]
+    platforms: list[Platform]
 
 
 type AzoulaSmartConfigEntry = ConfigEntry[AzoulaSmartData]
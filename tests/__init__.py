@@ -0,0 +1 @@
+"""Tests for the Azoula Smart Hub integration."""
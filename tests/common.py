@@ -0,0 +1,85 @@
+"""Test helpers for the Azoula Smart Hub integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import threading
+from typing import Any
+
+
+class FakeTimerHandle:
+    """Timer handle returned by FakeLoop.call_later."""
+
+    def __init__(self, delay: float, callback: Callable[..., Any], args: Any) -> None:
+        """Initialize the handle."""
+        self.delay = delay
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        self.cancelled = True
+
+    def fire(self) -> None:
+        """Run the timer callback."""
+        self.callback(*self.args)
+
+
+class FakeLoop:
+    """Event loop stand-in that records socket, callback and timer calls."""
+
+    def __init__(self) -> None:
+        """Initialize the loop."""
+        self.calls: list[tuple[str, int]] = []
+        self.readers: dict[int, Callable[..., Any]] = {}
+        self.writers: dict[int, Callable[..., Any]] = {}
+        self.ready: list[tuple[Callable[..., Any], tuple[Any, ...]]] = []
+        self.timers: list[FakeTimerHandle] = []
+
+    def add_reader(self, fd: int, callback: Callable[..., Any], *args: Any) -> None:
+        """Watch a descriptor for reading."""
+        self.calls.append(("add_reader", fd))
+        self.readers[fd] = callback
+
+    def remove_reader(self, fd: int) -> bool:
+        """Stop watching a descriptor for reading."""
+        self.calls.append(("remove_reader", fd))
+        return self.readers.pop(fd, None) is not None
+
+    def add_writer(self, fd: int, callback: Callable[..., Any], *args: Any) -> None:
+        """Watch a descriptor for writing."""
+        self.calls.append(("add_writer", fd))
+        self.writers[fd] = callback
+
+    def remove_writer(self, fd: int) -> bool:
+        """Stop watching a descriptor for writing."""
+        self.calls.append(("remove_writer", fd))
+        return self.writers.pop(fd, None) is not None
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Queue a callback."""
+        self.ready.append((callback, args))
+
+    call_soon_threadsafe = call_soon
+
+    def call_later(
+        self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> FakeTimerHandle:
+        """Record a timer."""
+        handle = FakeTimerHandle(delay, callback, args)
+        self.timers.append(handle)
+        return handle
+
+    def run_ready(self) -> None:
+        """Run the queued callbacks in order."""
+        while self.ready:
+            callback, args = self.ready.pop(0)
+            callback(*args)
+
+
+def run_in_thread(func: Callable[..., Any], *args: Any) -> None:
+    """Call a function on another thread, like paho does from the executor."""
+    thread = threading.Thread(target=func, args=args)
+    thread.start()
+    thread.join()
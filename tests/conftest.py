@@ -0,0 +1,26 @@
+"""Fixtures for Azoula Smart Hub tests."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from custom_components.sunricher_azoula.sdk.gateway import AzoulaGateway
+
+from .common import FakeLoop
+
+
+@pytest.fixture
+def fake_loop() -> FakeLoop:
+    """Return a fake event loop."""
+    return FakeLoop()
+
+
+@pytest.fixture
+def gateway(fake_loop: FakeLoop) -> AzoulaGateway:
+    """Return a gateway bound to the fake loop on the current thread."""
+    gateway = AzoulaGateway("127.0.0.1", "user", "password", "GW1")
+    gateway._loop = fake_loop  # type: ignore[assignment]
+    gateway._loop_thread_id = threading.get_ident()
+    return gateway
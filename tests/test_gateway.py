@@ -0,0 +1,402 @@
+"""Tests for the Azoula gateway client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+import logging
+import socket
+from typing import Any
+
+from paho.mqtt.client import MQTTMessage
+import pytest
+
+from custom_components.sunricher_azoula.sdk import gateway as gateway_module
+from custom_components.sunricher_azoula.sdk.const import CallbackEventType
+from custom_components.sunricher_azoula.sdk.exceptions import AzoulaGatewayError
+from custom_components.sunricher_azoula.sdk.gateway import AzoulaGateway
+
+from .common import FakeLoop, run_in_thread
+
+
+@pytest.fixture
+def sock() -> Iterator[socket.socket]:
+    """Return a socket that is closed after the test."""
+    with socket.socket() as sock:
+        yield sock
+
+
+def test_socket_open_registers_reader(
+    gateway: AzoulaGateway, fake_loop: FakeLoop, sock: socket.socket
+) -> None:
+    """Test the loop reads the socket and services keepalives once it opens."""
+    gateway._on_socket_open(gateway._mqtt_client, None, sock)
+
+    assert fake_loop.readers == {sock.fileno(): gateway._mqtt_client.loop_read}
+    assert len(fake_loop.timers) == 1
+
+
+def test_socket_open_from_executor_runs_on_loop(
+    gateway: AzoulaGateway, fake_loop: FakeLoop, sock: socket.socket
+) -> None:
+    """Test a socket opened on another thread is registered by the loop."""
+    run_in_thread(gateway._on_socket_open, gateway._mqtt_client, None, sock)
+    assert not fake_loop.readers
+
+    fake_loop.run_ready()
+
+    assert list(fake_loop.readers) == [sock.fileno()]
+
+
+def test_socket_close_unregisters_recorded_descriptor(
+    gateway: AzoulaGateway, fake_loop: FakeLoop
+) -> None:
+    """Test a socket closed on another thread is unregistered by descriptor."""
+    sock = socket.socket()
+    fd = sock.fileno()
+    gateway._on_socket_open(gateway._mqtt_client, None, sock)
+    misc_handle = fake_loop.timers[0]
+
+    # paho closes the socket right after the close callback returns.
+    run_in_thread(gateway._on_socket_close, gateway._mqtt_client, None, sock)
+    sock.close()
+    fake_loop.run_ready()
+
+    assert fake_loop.calls[-2:] == [("remove_reader", fd), ("remove_writer", fd)]
+    assert not fake_loop.readers
+    assert misc_handle.cancelled
+
+
+def test_reconnect_reusing_descriptor(
+    gateway: AzoulaGateway, fake_loop: FakeLoop
+) -> None:
+    """Test a new socket reusing the old descriptor number is registered."""
+    old_sock = socket.socket()
+    fd = old_sock.fileno()
+    gateway._on_socket_open(gateway._mqtt_client, None, old_sock)
+
+    def reconnect() -> socket.socket:
+        gateway._on_socket_close(gateway._mqtt_client, None, old_sock)
+        old_sock.close()
+        new_sock = socket.socket()
+        gateway._on_socket_open(gateway._mqtt_client, None, new_sock)
+        return new_sock
+
+    new_socks: list[socket.socket] = []
+    run_in_thread(lambda: new_socks.append(reconnect()))
+    with new_socks[0] as new_sock:
+        assert new_sock.fileno() == fd
+        fake_loop.run_ready()
+
+        assert fake_loop.calls == [
+            ("add_reader", fd),
+            ("remove_reader", fd),
+            ("remove_writer", fd),
+            ("add_reader", fd),
+        ]
+        assert fake_loop.readers == {fd: gateway._mqtt_client.loop_read}
+
+
+def test_socket_close_ignores_unknown_socket(
+    gateway: AzoulaGateway, fake_loop: FakeLoop, sock: socket.socket
+) -> None:
+    """Test closing a socket the loop never serviced changes nothing."""
+    gateway._on_socket_open(gateway._mqtt_client, None, sock)
+
+    with socket.socket() as other_sock:
+        gateway._on_socket_close(gateway._mqtt_client, None, other_sock)
+
+    assert list(fake_loop.readers) == [sock.fileno()]
+    assert not fake_loop.timers[0].cancelled
+
+
+def test_socket_register_write(
+    gateway: AzoulaGateway, fake_loop: FakeLoop, sock: socket.socket
+) -> None:
+    """Test the socket is watched for writing while packets are queued."""
+    gateway._on_socket_open(gateway._mqtt_client, None, sock)
+
+    gateway._on_socket_register_write(gateway._mqtt_client, None, sock)
+    assert fake_loop.writers == {sock.fileno(): gateway._mqtt_client.loop_write}
+
+    gateway._on_socket_unregister_write(gateway._mqtt_client, None, sock)
+    assert not fake_loop.writers
+
+
+def test_socket_register_write_ignores_stale_socket(
+    gateway: AzoulaGateway, fake_loop: FakeLoop, sock: socket.socket
+) -> None:
+    """Test a write request for a replaced socket is ignored."""
+    gateway._on_socket_open(gateway._mqtt_client, None, sock)
+
+    with socket.socket() as stale_sock:
+        gateway._on_socket_register_write(gateway._mqtt_client, None, stale_sock)
+
+    assert not fake_loop.writers
+
+
+def test_reconnect_backs_off_and_survives_any_error(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test reconnect retries with a growing delay until it succeeds."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(gateway_module.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(gateway_module, "DEFAULT_RECONNECT_MAX_DELAY", 4.0)
+
+    async def run() -> None:
+        gateway = AzoulaGateway("127.0.0.1", "user", "password", "GW1")
+        gateway._loop = asyncio.get_running_loop()
+        errors: list[Exception] = [
+            OSError("refused"),
+            ValueError("bad handshake"),
+            OSError("refused"),
+            OSError("refused"),
+        ]
+
+        def reconnect() -> None:
+            if errors:
+                raise errors.pop(0)
+
+        monkeypatch.setattr(gateway._mqtt_client, "reconnect", reconnect)
+
+        gateway._handle_disconnect(True)
+        task = gateway._reconnect_task
+        assert task is not None
+
+        # A second drop while reconnecting does not start another task.
+        gateway._handle_disconnect(True)
+        assert gateway._reconnect_task is task
+
+        await task
+        assert not errors
+        assert gateway._reconnect_task is None
+
+    with caplog.at_level(logging.WARNING):
+        asyncio.run(run())
+
+    assert delays == [1.0, 2.0, 4.0, 4.0, 4.0]
+    assert "bad handshake" in caplog.text
+
+
+def test_expected_disconnect_does_not_reconnect(
+    gateway: AzoulaGateway, fake_loop: FakeLoop
+) -> None:
+    """Test a requested disconnect leaves the gateway offline."""
+    gateway._handle_disconnect(False)
+
+    assert gateway._reconnect_task is None
+
+
+@pytest.mark.parametrize(
+    ("result", "message"),
+    [(5, "Authentication failed"), (3, "Connection failed with code 3")],
+)
+def test_connect_rejected_tears_down(
+    monkeypatch: pytest.MonkeyPatch, result: int, message: str
+) -> None:
+    """Test a rejected connection is torn down instead of retried."""
+
+    async def run() -> None:
+        gateway = AzoulaGateway("127.0.0.1", "user", "password", "GW1")
+        client = gateway._mqtt_client
+        disconnects: list[None] = []
+
+        def connect(host: str, port: int) -> None:
+            gateway._on_connect(client, None, {}, result)
+
+        monkeypatch.setattr(client, "connect", connect)
+        monkeypatch.setattr(client, "disconnect", lambda: disconnects.append(None))
+
+        with pytest.raises(AzoulaGatewayError, match=message):
+            await gateway.connect()
+
+        assert disconnects
+        assert gateway._reconnect_task is None
+        assert gateway._misc_handle is None
+        assert not gateway._connection_event.is_set()
+
+    asyncio.run(run())
+
+
+def test_connect_accepted(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test an accepted connection marks the gateway online."""
+
+    async def run() -> None:
+        gateway = AzoulaGateway("127.0.0.1", "user", "password", "GW1")
+        client = gateway._mqtt_client
+        online: list[bool] = []
+        gateway.register_listener(
+            CallbackEventType.ONLINE_STATUS,
+            lambda dev_id, available: online.append(available),
+        )
+
+        def connect(host: str, port: int) -> None:
+            gateway._on_connect(client, None, {}, 0)
+
+        monkeypatch.setattr(client, "connect", connect)
+        monkeypatch.setattr(client, "subscribe", lambda topic: None)
+
+        await gateway.connect()
+
+        assert online == [True]
+
+    asyncio.run(run())
+
+
+def _message(payload: bytes) -> MQTTMessage:
+    """Return an MQTT message as paho delivers it."""
+    msg = MQTTMessage(topic=b"meribee/platform-app/GW1")
+    msg.payload = payload
+    return msg
+
+
+def test_inbox_processes_burst_in_one_pass(
+    gateway: AzoulaGateway, fake_loop: FakeLoop
+) -> None:
+    """Test messages from one socket read are decoded in a single pass."""
+    for _ in range(3):
+        gateway._on_message(gateway._mqtt_client, None, _message(b"{}"))
+
+    assert len(gateway._inbox) == 3
+    assert fake_loop.ready == [(gateway._process_inbox, ())]
+
+    fake_loop.run_ready()
+
+    assert not gateway._inbox
+    assert not gateway._inbox_scheduled
+
+
+def test_inbox_drops_oldest_when_full(
+    monkeypatch: pytest.MonkeyPatch, fake_loop: FakeLoop
+) -> None:
+    """Test the inbox keeps the newest messages when it overflows."""
+    monkeypatch.setattr(gateway_module, "MAX_PENDING_MESSAGES", 2)
+    gateway = AzoulaGateway("127.0.0.1", "user", "password", "GW1")
+    gateway._loop = fake_loop  # type: ignore[assignment]
+
+    messages = [_message(b"{}") for _ in range(3)]
+    for msg in messages:
+        gateway._on_message(gateway._mqtt_client, None, msg)
+
+    assert list(gateway._inbox) == messages[1:]
+
+
+def _post(gateway: AzoulaGateway, **values: int) -> None:
+    """Deliver a property post for dev1."""
+    gateway._handle_property_post(
+        {
+            "method": "thing.event.property.post",
+            "deviceID": "dev1",
+            "params": {key: {"value": value} for key, value in values.items()},
+        }
+    )
+
+
+@pytest.fixture
+def updates(gateway: AzoulaGateway) -> list[tuple[str, dict[str, Any]]]:
+    """Return the property updates dispatched for dev1."""
+    updates: list[tuple[str, dict[str, Any]]] = []
+    gateway.register_listener(
+        CallbackEventType.PROPERTY_UPDATE,
+        lambda dev_id, status: updates.append((dev_id, dict(status))),
+        device_id="dev1",
+    )
+    return updates
+
+
+def test_property_update_dispatched_immediately(
+    gateway: AzoulaGateway,
+    fake_loop: FakeLoop,
+    updates: list[tuple[str, dict[str, Any]]],
+) -> None:
+    """Test an isolated property update is not delayed."""
+    _post(gateway, OnOff=1)
+
+    assert updates == [("dev1", {"OnOff": {"value": 1}})]
+
+    # Nothing else arrived in the window, so closing it dispatches nothing.
+    fake_loop.timers[0].fire()
+    assert len(updates) == 1
+    assert not gateway._property_update_window
+
+
+def test_property_updates_merged_in_arrival_order(
+    gateway: AzoulaGateway,
+    fake_loop: FakeLoop,
+    updates: list[tuple[str, dict[str, Any]]],
+) -> None:
+    """Test a burst is merged with each property where it was last reported."""
+    _post(gateway, OnOff=1)
+    _post(gateway, ColorTemperature=3000)
+    _post(gateway, CurrentHue=120, CurrentSaturation=50)
+    _post(gateway, ColorTemperature=4000)
+    assert len(updates) == 1
+
+    fake_loop.timers[0].fire()
+
+    assert updates[1] == (
+        "dev1",
+        {
+            "CurrentHue": {"value": 120},
+            "CurrentSaturation": {"value": 50},
+            "ColorTemperature": {"value": 4000},
+        },
+    )
+    assert list(updates[1][1]) == [
+        "CurrentHue",
+        "CurrentSaturation",
+        "ColorTemperature",
+    ]
+
+
+def test_property_update_window_follows_burst(
+    gateway: AzoulaGateway,
+    fake_loop: FakeLoop,
+    updates: list[tuple[str, dict[str, Any]]],
+) -> None:
+    """Test a sustained burst is dispatched once per window."""
+    _post(gateway, CurrentLevel=10)
+    _post(gateway, CurrentLevel=20)
+    fake_loop.timers[0].fire()
+    assert [status for _, status in updates] == [
+        {"CurrentLevel": {"value": 10}},
+        {"CurrentLevel": {"value": 20}},
+    ]
+
+    # The device was just notified, so the next post waits for the window.
+    _post(gateway, CurrentLevel=30)
+    assert len(updates) == 2
+    fake_loop.timers[1].fire()
+    assert updates[-1] == ("dev1", {"CurrentLevel": {"value": 30}})
+
+    # After a quiet window the next post is dispatched right away.
+    fake_loop.timers[2].fire()
+    _post(gateway, CurrentLevel=40)
+    assert updates[-1] == ("dev1", {"CurrentLevel": {"value": 40}})
+
+
+def test_property_get_reply_not_merged(
+    gateway: AzoulaGateway,
+    fake_loop: FakeLoop,
+    updates: list[tuple[str, dict[str, Any]]],
+) -> None:
+    """Test a get reply is dispatched at once and supersedes merged posts."""
+    _post(gateway, OnOff=1)
+    _post(gateway, OnOff=0, CurrentLevel=20)
+
+    gateway._handle_property_get_reply(
+        {
+            "method": "thing.service.property.get.reply",
+            "code": 200,
+            "deviceID": "dev1",
+            "data": {"OnOff": 1},
+        }
+    )
+    assert updates[-1] == ("dev1", {"OnOff": {"value": 1}})
+
+    fake_loop.timers[0].fire()
+    assert updates[-1] == ("dev1", {"CurrentLevel": {"value": 20}})